@@ -18,36 +18,59 @@
 #
 # vifa_launcher/config/io.py
 from __future__ import annotations
+import functools
 import json
 import os
-from dataclasses import dataclass, asdict, field
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Literal, Optional, List, Dict
+from typing import Callable, Literal, Optional, List, Dict
+try:
+    import orjson  # optional, faster bytes-in/bytes-out JSON
+except ImportError:
+    orjson = None
 # -------------------------------------------------
 # Constants / App Name
 # -------------------------------------------------
 _APP_NAME = "VIfA-Launcher"
+# Interned string defaults: loaded values are interned too, so instances
+# share one object and equality checks hit the identity fast path
+_SLIDE = sys.intern("slide")
+_CTRL_COMMA = sys.intern("Ctrl+,")
+_WHITE = sys.intern("#FFFFFF")
+_BG_COLOR = sys.intern("#510545")
+_WP_SYNC = sys.intern("wp_sync")
+_BACKGROUND_MODES = (_WP_SYNC, sys.intern("custom_image"), sys.intern("color"))
 # -------------------------------------------------
 # XDG Paths
 # -------------------------------------------------
+def _resolve_home() -> Path:
+    h = os.environ.get("HOME") or os.path.expanduser("~")
+    return Path(h if h and h != "~" else "/tmp")
+_HOME = _resolve_home()  # once per process
+@functools.lru_cache(maxsize=None)
 def _xdg_config_home() -> Path:
     x = os.environ.get("XDG_CONFIG_HOME")
-    return Path(x) if x else (Path.home() / ".config")
+    return Path(x) if x else (_HOME / ".config")
+@functools.lru_cache(maxsize=None)
 def _xdg_cache_home() -> Path:
     x = os.environ.get("XDG_CACHE_HOME")
-    return Path(x) if x else (Path.home() / ".cache")
+    return Path(x) if x else (_HOME / ".cache")
+@functools.lru_cache(maxsize=None)
 def get_config_path(prefer_env: bool = True) -> Path:
     """
     Path to settings file:
       $XDG_CONFIG_HOME/app_launcher/settings.json
       or ~/.config/app_launcher/settings.json
     """
-    base = _xdg_config_home() if prefer_env else (Path.home() / ".config")
+    base = _xdg_config_home() if prefer_env else (_HOME / ".config")
     return base / _APP_NAME / "settings.json"
+@functools.lru_cache(maxsize=None)
 def get_runtime_paths() -> Dict[str, Path]:
     """
     Unified runtime paths (XDG Cache) for generated files.
     Shared by wallpaper_sync.py and main.py.
+    Resolved (and the cache dir created) once per process.
     """
     cache_dir = _xdg_cache_home() / _APP_NAME
     cache_dir.mkdir(parents=True, exist_ok=True)
@@ -58,23 +81,29 @@ def get_runtime_paths() -> Dict[str, Path]:
         "state_custom": cache_dir / "wp_state_custom.json",  # render state for custom
     }
 # Default directories for .desktop files used by main.py/Loader:
-_DEFAULT_DESKTOP_DIRS = [
-    str(Path.home() / ".local/share/applications"),
-    "/var/lib/flatpak/exports/share/applications",
-    "/var/lib/snapd/desktop/applications",
-    "/usr/share/applications",
-    "/usr/local/share/applications",
-]
+@functools.lru_cache(maxsize=None)
+def default_desktop_dirs() -> tuple[str, ...]:
+    """
+    Existing default .desktop directories, probed once per process.
+    """
+    paths = (
+        str(_HOME / ".local/share/applications"),
+        "/var/lib/flatpak/exports/share/applications",
+        "/var/lib/snapd/desktop/applications",
+        "/usr/share/applications",
+        "/usr/local/share/applications",
+    )
+    return tuple(p for p in paths if os.path.isdir(p))
 # -------------------------------------------------
 # Settings Model
 # -------------------------------------------------
 BackgroundMode = Literal["wp_sync", "custom_image", "color"]
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings:
     # ---- General/UI ----
-    animation: str = "slide"               # "slide", "fade", "none", …
+    animation: str = _SLIDE                # "slide", "fade", "none", …
     anim_duration_ms: int = 280
-    settings_shortcut: str = "Ctrl+,"
+    settings_shortcut: str = _CTRL_COMMA
     ui_scale: float = 1.10
     min_readable_px: int = 16
     # ---- Layout / Icons ----
@@ -84,13 +113,13 @@ class Settings:
     grid_margins_lr: int = 200
     font_family: str = ""
     font_point_size: int = 12
-    font_color: str = "#FFFFFF"
+    font_color: str = _WHITE
     # ---- Filter/Icons ----
     filter_only_apps_with_icon: bool = False
     use_theme_fallback: bool = True
     # ---- Background ----
-    background_mode: BackgroundMode = "wp_sync"
-    background_color: str = "#510545"
+    background_mode: BackgroundMode = _WP_SYNC
+    background_color: str = _BG_COLOR
     blur_percent: int = 70
     background_custom_path: str = ""
     background_dim_alpha: int = 80  # NEW: Background dimming (0–255 recommended)
@@ -100,92 +129,180 @@ class Settings:
     # ---- Input Behavior ----
     wheel_sensitivity: float = 1.0  # valid: 0.1–3.0
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat fields only: shallow-copy the str lists instead of asdict()'s deepcopy
+        d = {n: getattr(self, n) for n in _FIELD_NAMES}
+        d["desktop_dirs_custom"] = list(self.desktop_dirs_custom)
+        d["desktop_dirs_disabled"] = list(self.desktop_dirs_disabled)
+        return d
+_FIELD_NAMES = tuple(f.name for f in fields(Settings))
+# Numeric fields with their accepted bounds: (name, lo, hi)
+_INT_COERCE = (
+    ("anim_duration_ms", 0, 5000),
+    ("blur_percent", 0, 100),
+    ("page_size", 1, 500),
+    ("icons_per_row", 1, 32),
+    ("icon_size", 16, 512),
+    ("grid_margins_lr", 0, 2000),
+    ("min_readable_px", 8, 64),
+    ("font_point_size", 6, 72),
+    ("background_dim_alpha", 0, 255),
+)
+_FLOAT_COERCE = (
+    ("ui_scale", 0.5, 4.0),
+    ("wheel_sensitivity", 0.1, 3.0),
+)
+# Scalar defaults, used as fallback for rejected numeric values
+_DEFAULTS = {f.name: f.default for f in fields(Settings)}
 # -------------------------------------------------
 # JSON I/O Helpers
 # -------------------------------------------------
-CONFIG_FILE: Path = get_config_path(prefer_env=True)
+@functools.lru_cache(maxsize=None)
+def _config_file() -> Path:
+    return get_config_path(prefer_env=True)
 def _ensure_parent_dir(p: Path) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
 def _read_json(p: Path) -> dict:
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        data = p.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
     except Exception:
         return {}
+def _dump_json(obj: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+def _fsync_dir(d: Path) -> None:
+    try:
+        fd = os.open(str(d), os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 def _write_json_atomic(p: Path, obj: dict) -> None:
+    """
+    Durable replace: the temp file is fsync'ed before the rename and the
+    parent directory afterwards, so a crash never leaves a truncated file.
+    Single-file path on plain write/fsync/rename syscalls; no batching or
+    async I/O layer, which would only add setup cost for one small file.
+    """
+    _ensure_parent_dir(p)
+    tmp = p.with_name(p.name + ".tmp")
+    data = memoryview(_dump_json(obj))
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, p)
+    _fsync_dir(p.parent)
+def _write_json_replace(p: Path, obj: dict) -> None:
+    """
+    Atomic but not durable: for regenerable runtime/cache state.
+    """
     _ensure_parent_dir(p)
-    tmp = p.with_suffix(p.suffix + ".tmp")
-    tmp.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
-    tmp.replace(p)
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_bytes(_dump_json(obj))
+    os.replace(tmp, p)
 def _coerce_background_mode(val: object) -> BackgroundMode:
-    v = str(val or "wp_sync")
-    return v if v in ("wp_sync", "custom_image", "color") else "wp_sync"
+    v = str(val or _WP_SYNC)
+    return sys.intern(v) if v in _BACKGROUND_MODES else _WP_SYNC
+def _intern_str(val: object) -> object:
+    return sys.intern(val) if type(val) is str else val
 def _coerce_int(val: object, lo: int, hi: int, default: int) -> int:
+    # Fast path: freshly written JSON already holds ints
+    if type(val) is int:
+        return val if lo <= val <= hi else default
     try:
         iv = int(val)
-        if lo <= iv <= hi:
-            return iv
-    except Exception:
-        pass
-    return default
+    except (TypeError, ValueError, OverflowError):
+        return default
+    return iv if lo <= iv <= hi else default
 def _coerce_float(val: object, lo: float, hi: float, default: float) -> float:
+    if type(val) is float or type(val) is int:
+        return float(val) if lo <= val <= hi else default
     try:
         fv = float(val)
-        if lo <= fv <= hi:
-            return fv
-    except Exception:
-        pass
-    return default
+    except (TypeError, ValueError):
+        return default
+    return fv if lo <= fv <= hi else default
+def _coerce_custom_path(val: object) -> str:
+    return val.strip().strip("\"'") if isinstance(val, str) else ""
+# One validator per known field (None = taken over verbatim), so parsing
+# and validation happen in a single pass over the keys present in the JSON
+_FIELD_COERCERS: Dict[str, Optional[Callable[[object], object]]] = dict.fromkeys(_FIELD_NAMES)
+for _name, _lo, _hi in _INT_COERCE:
+    _FIELD_COERCERS[_name] = functools.partial(_coerce_int, lo=_lo, hi=_hi, default=_DEFAULTS[_name])
+for _name, _lo, _hi in _FLOAT_COERCE:
+    _FIELD_COERCERS[_name] = functools.partial(_coerce_float, lo=_lo, hi=_hi, default=_DEFAULTS[_name])
+for _name in ("animation", "settings_shortcut", "font_color", "background_color"):
+    _FIELD_COERCERS[_name] = _intern_str
+_FIELD_COERCERS["background_mode"] = _coerce_background_mode
+_FIELD_COERCERS["background_custom_path"] = _coerce_custom_path
+del _name, _lo, _hi
 # -------------------------------------------------
 # Public API
 # -------------------------------------------------
+def settings_summary() -> Settings:
+    """
+    Default settings without touching the disk.
+    """
+    return Settings()
+def _settings_from_raw(raw: dict) -> Settings:
+    # Known keys only; rejected values fall back to the field default
+    overrides = {}
+    for key in raw.keys() & _FIELD_COERCERS.keys():
+        coerce = _FIELD_COERCERS[key]
+        overrides[key] = raw[key] if coerce is None else coerce(raw[key])
+    return Settings(**overrides)
+# Last parsed settings, keyed by (st_mtime_ns, st_size) of the config file
+_settings_cache: Optional[tuple] = None
+def invalidate_settings_cache() -> None:
+    """
+    Forget the parsed settings so the next load_settings() re-reads the file.
+    """
+    global _settings_cache
+    _settings_cache = None
 def load_settings() -> Settings:
     """
     Loads settings and merges known fields with defaults.
     Unknown keys are ignored (forward/backward compatible).
+    The file is only re-parsed when its mtime or size changed; the
+    returned instance is frozen and shared, use dataclasses.replace().
     """
-    raw: dict = {}
-    if CONFIG_FILE.exists():
-        raw = _read_json(CONFIG_FILE)
-    s = Settings()  # Defaults
-    # Background with coercion
-    s.background_mode = _coerce_background_mode(raw.get("background_mode"))
-    s.blur_percent = _coerce_int(raw.get("blur_percent"), 0, 100, s.blur_percent)
-    custom = raw.get("background_custom_path") or ""
-    if isinstance(custom, str):
-        s.background_custom_path = custom.strip().strip('"').strip("'")
-    # Take over all other known fields if present
-    for key in (
-        "animation", "anim_duration_ms", "settings_shortcut",
-        "ui_scale", "min_readable_px",
-        "page_size", "icons_per_row", "icon_size", "grid_margins_lr",
-        "font_family", "font_point_size", "font_color",
-        "filter_only_apps_with_icon", "use_theme_fallback",
-        "background_color", "background_dim_alpha",  # NEW taken over
-        "desktop_dirs_custom", "desktop_dirs_disabled",
-    ):
-        if key in raw:
-            try:
-                setattr(s, key, raw[key])
-            except Exception:
-                # robust against wrong types/old files
-                pass
-    # Take over wheel_sensitivity robustly (with bounds 0.1–3.0)
-    if "wheel_sensitivity" in raw:
-        s.wheel_sensitivity = _coerce_float(
-            raw.get("wheel_sensitivity"),
-            0.1, 3.0,
-            s.wheel_sensitivity
-        )
+    global _settings_cache
+    config_file = _config_file()
+    try:
+        st = os.stat(config_file)
+    except OSError:
+        return settings_summary()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _settings_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    s = _settings_from_raw(_read_json(config_file))
+    _settings_cache = (key, s)
     return s
 def save_settings(settings: Settings, path: Optional[Path] = None) -> Path:
-    target = path or CONFIG_FILE
+    # One file: stays on the durable direct-syscall writer
+    target = path or _config_file()
     _write_json_atomic(target, settings.to_dict())
+    invalidate_settings_cache()
     return target
+def save_runtime_state(path: Path, state: dict) -> None:
+    """
+    Write a wallpaper render state file (see get_runtime_paths()).
+    """
+    _write_json_replace(path, state)
 def load_or_create_defaults() -> Settings:
-    if CONFIG_FILE.exists():
+    if _config_file().exists():
         return load_settings()
-    s = Settings()
-    save_settings(s, CONFIG_FILE)
+    s = settings_summary()
+    save_settings(s)
     return s
 
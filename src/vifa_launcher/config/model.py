@@ -17,38 +17,6 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 #
 
-from dataclasses import dataclass, field
-from typing import List
+from .io import Settings  # re-export
 
-@dataclass
-class Settings:
-    # UI / Animation
-    animation: str = "slide"   # 'none' | 'slide' | 'fade'
-    anim_duration_ms: int = 280
-
-    # Background
-    background_mode: str = "wp_sync"      # "wp_sync" | "custom_image" | "color"
-    background_custom_path: str = ""
-    background_color: str = "#510545"
-
-    # Blur (0–100 %)
-    blur_percent: int = 70
-
-    # Shortcut
-    settings_shortcut: str = "Ctrl+,"
-
-    # ---- Advanced Display ----
-    page_size: int = 35
-    icons_per_row: int = 7
-    icon_size: int = 115
-    grid_margins_lr: int = 200
-    font_family: str = ""        # leer => System
-    font_point_size: int = 12
-    font_color: str = "#FFFFFF"
-
-    filter_only_apps_with_icon: bool = False
-    use_theme_fallback: bool = True
-
-    # Application directories (.desktop)
-    desktop_dirs_custom: List[str] = field(default_factory=list)
-    desktop_dirs_disabled: List[str] = field(default_factory=list)
+__all__ = ["Settings"]
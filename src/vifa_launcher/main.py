@@ -20,23 +20,32 @@ import os
 os.environ.setdefault("QT_AUTO_SCREEN_SCALE_FACTOR", "1")
 os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
 os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "PassThrough")
-import sys, json, re, subprocess, unicodedata, shutil, shlex, html
+import sys, re, bisect, pickle, unicodedata, shutil, functools, hashlib, threading, time
 from pathlib import Path
-import numpy as np
 from PyQt5.QtCore import (
     Qt, QSize, QEvent, QRunnable, QThreadPool, pyqtSignal, QObject,
-    QDir, QDirIterator, QRect, QTimer, QProcess, QPropertyAnimation, QElapsedTimer,
-    QEasingCurve, QCoreApplication, QFileSystemWatcher, QIODevice, QFile
+    QRect, QTimer, QProcess, QPropertyAnimation, QElapsedTimer,
+    QEasingCurve, QCoreApplication, QFileSystemWatcher, QIODevice, QFile, QT_VERSION
 )
 from PyQt5.QtGui import (
-    QIcon, QFont, QPixmap, QPainter, QColor, QImage, QKeySequence, QGuiApplication, QTextDocument, QPixmapCache
+    QIcon, QFont, QPixmap, QPainter, QColor, QImage, QKeySequence, QGuiApplication, QFontMetrics
 )
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
     QLabel, QStackedWidget, QGridLayout, QDialog, QSizePolicy,
     QGraphicsOpacityEffect, QShortcut
 )
-from .config.io import load_settings, _DEFAULT_DESKTOP_DIRS, get_runtime_paths
+try:
+    import gi
+    gi.require_version("GLib", "2.0")
+    from gi.repository import GLib  # optional: C .desktop parser (GKeyFile)
+except (ImportError, ValueError):
+    GLib = None
+try:
+    import msgpack  # optional: faster app-cache (de)serialization
+except ImportError:
+    msgpack = None
+from .config.io import load_settings, default_desktop_dirs, get_runtime_paths
 from .transitions.registry import registry
 
 # ============================================================================
@@ -77,6 +86,23 @@ QPushButton:focus {
 }
 """
 
+# Page indicator dots (parsed once per state change, not per dot)
+DOT_QSS_ACTIVE = "font-size: 16px; color: white"
+DOT_QSS_INACTIVE = "font-size: 16px; color: gray"
+
+# High-DPI scaling is always on in Qt 6; the AA_* attributes only matter on Qt 5
+_IS_QT6 = QT_VERSION >= 0x060000
+
+# Page container: transparent children plus the app-name label style (QLabel role="name"),
+# set once per page instead of one stylesheet per label
+PAGE_QSS = "* {{ background: transparent; }} QLabel[role=\"name\"] {{ color: {color}; padding-top: 2px; }}"
+
+# Keys the launcher handles itself; any other printable key press is typed into the search bar
+_NAV_KEYS = frozenset((Qt.Key_Return, Qt.Key_Enter, Qt.Key_Escape, Qt.Key_Tab,
+                       Qt.Key_Backspace, Qt.Key_Delete, Qt.Key_Left, Qt.Key_Right,
+                       Qt.Key_Up, Qt.Key_Down))
+_CTRL_ALT_MASK = int(Qt.ControlModifier | Qt.AltModifier)
+
 BASE_DIR = Path(__file__).resolve().parent
 ICON_SEARCH_PATHS = [
     "/usr/share/pixmaps",
@@ -88,40 +114,68 @@ ICON_SEARCH_PATHS = [
     "/var/lib/flatpak/exports/share/icons",
     "/var/lib/snapd/desktop/icons",
 ]
-CACHE_FILE = Path.home() / ".cache/VIfA-Launcher/apps_v2.json"
-CACHE_SCHEMA_VERSION = 4
+_ICON_EXTS = ("", ".png", ".svg", ".xpm")
+CACHE_FILE = Path.home() / ".cache/VIfA-Launcher/apps_v2.msgpack"
+CACHE_SCHEMA_VERSION = 6
+ICON_CACHE_DIR = Path.home() / ".cache/VIfA-Launcher/icons_v1"
+ICON_RENDER_VERSION = 2  # part of the icon cache key: bump whenever _rasterize_icon_uniform's output changes
+ICON_CACHE_MAX_BYTES = 32 * 1024 * 1024
 INDEX_ALL_LOCALES = True
 ACCENT_FOLDING = True  # Normalize accented characters for search
 
+@functools.lru_cache(maxsize=1)
+def _icon_index():
+    """
+    Map icon names to files in ICON_SEARCH_PATHS, built with one scandir per directory.
+    Resolution order matches a per-name probe: earlier directories win, then "" > .png > .svg > .xpm.
+    """
+    index = {}
+    for base in ICON_SEARCH_PATHS:
+        try:
+            with os.scandir(base) as it:
+                files = [(e.name, e.path) for e in it if not e.is_dir()]
+        except OSError:
+            continue
+        local = {}
+        for ext in _ICON_EXTS:
+            n = len(ext)
+            for fname, path in files:
+                if not ext: local.setdefault(fname, path)
+                elif fname.endswith(ext) and len(fname) > n: local.setdefault(fname[:-n], path)
+        for name, path in local.items():
+            index.setdefault(name, path)
+    return index
+
+# Exec field codes: those dropped entirely, and a single-pass matcher for inline codes
+_DROPPED_FIELD_CODES = frozenset(("%f","%F","%u","%U","%d","%D","%n","%N","%v","%m"))
+_FIELD_CODE_RE = re.compile(r"%[fFuUdDnNvmick%]")
+
 def _substitute_field_codes(args, name="", icon=None, desktop_file=None):
     """
     Substitute % codes in desktop file Exec fields according to the Desktop Entry Specification.
-    Supported: %i, %c, %k. Unsupported codes are removed.
+    Supported: %i, %c, %k, %%. Unsupported codes are removed.
     """
+    if not any("%" in a for a in args):
+        return [a for a in args if a]
+    icon_abs = icon if (icon and os.path.isabs(icon)) else ""
+    subs = {"%i": icon_abs, "%c": name or "", "%k": desktop_file or "", "%%": "%"}
+    repl = lambda m: subs.get(m.group(), "")
     out = []
     for a in args:
-        a = a.replace("%%", "%")
-        if a in {"%f","%F","%u","%U","%d","%D","%n","%N","%v","%m"}:
+        if "%" not in a:
+            if a: out.append(a)
             continue
-        if a == "%i":
-            if icon and os.path.isabs(icon):
-                out.extend(["--icon", icon])
+        if a in _DROPPED_FIELD_CODES:
             continue
-        if a == "%c":
-            if name:
-                out.append(name)
+        if a == "%i":
+            if icon_abs:
+                out.extend(["--icon", icon_abs])
             continue
-        if a == "%k":
-            if desktop_file:
-                out.append(desktop_file)
+        if a == "%c" or a == "%k":
+            if subs[a]:
+                out.append(subs[a])
             continue
-        for code in ("%f","%F","%u","%U","%d","%D","%n","%N","%v","%m"):
-            a = a.replace(code, "")
-        if "%i" in a:
-            a = a.replace("%i", icon if (icon and os.path.isabs(icon)) else "")
-        a = a.replace("%c", name or "")
-        if "%k" in a and desktop_file:
-            a = a.replace("%k", desktop_file)
+        a = _FIELD_CODE_RE.sub(repl, a)
         if a:
             out.append(a)
     return out
@@ -140,43 +194,69 @@ _TERMINAL_CANDIDATES = [
     ["xterm","-e"],
 ]
 
+_TERMINAL_NAMES = frozenset(c[0] for c in _TERMINAL_CANDIDATES)
+
+@functools.lru_cache(maxsize=256)
+def _which(prog: str):
+    """
+    shutil.which, memoized per program name.
+    """
+    return shutil.which(prog)
+
+@functools.lru_cache(maxsize=1)
+def _chosen_terminal():
+    """
+    The first available terminal from _TERMINAL_CANDIDATES as [path, *flags], or None.
+    """
+    for cand in _TERMINAL_CANDIDATES:
+        term = _which(cand[0])
+        if term:
+            return (term, *cand[1:])
+    return None
+
 def _wrap_in_terminal(argv):
     """
     Wrap a command in a terminal emulator if it's not already a terminal.
     """
     if not argv: return argv
-    prog = shutil.which(argv[0]) or argv[0]
-    base = os.path.basename(prog).lower()
-    if base in {"gnome-terminal","konsole","xfce4-terminal","mate-terminal","tilix","lxterminal","alacritty","kitty","xterm","x-terminal-emulator"}:
+    prog = _which(argv[0]) or argv[0]
+    if os.path.basename(prog).lower() in _TERMINAL_NAMES:
         return argv
-    for cand in _TERMINAL_CANDIDATES:
-        term = shutil.which(cand[0])
-        if term:
-            return [term] + cand[1:] + argv
-    return argv
+    term = _chosen_terminal()
+    return argv if term is None else [*term, *argv]
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_token(s: str) -> str:
     """
     Normalize a string for search: NFKC normalization, casefolding, and optional accent folding.
+    Pure-ASCII input is already in normal form, so it only needs lowercasing.
     """
     if not s: return ""
+    if s.isascii(): return s.lower()
     s = unicodedata.normalize("NFKC", s).casefold()
     if ACCENT_FOLDING:
         s = "".join(ch for ch in unicodedata.normalize("NFKD", s) if not unicodedata.combining(ch))
     return s
 
+@functools.lru_cache(maxsize=128)
+def _parse_qcolor_cached(s: str, default: str) -> QColor:
+    c = QColor(s)
+    if not c.isValid(): c = QColor(default)
+    return c
+
 def _parse_qcolor(s: str, default="#202020") -> QColor:
     """
     Parse a color string into a QColor, falling back to default if invalid.
+    Parses are memoized; callers get their own copy since QColor is mutable.
     """
-    c = QColor(s)
-    if not c.isValid(): c = QColor(default)
-    return c
+    return QColor(_parse_qcolor_cached(s, default))
 
 class AnimatedStackedWidget(QStackedWidget):
     """
     A QStackedWidget with animated transitions between pages.
     """
+    animation_finished = pyqtSignal()  # emitted once an animated page switch has completed
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_NoSystemBackground, True)
@@ -224,6 +304,7 @@ class AnimatedStackedWidget(QStackedWidget):
             finally:
                 self.is_animating = False
                 self._anim_group = None
+                self.animation_finished.emit()
         try:
             grp.finished.connect(on_finished); grp.start()
         except Exception:
@@ -236,10 +317,12 @@ class AppLoadSignals(QObject):
     Signals for asynchronous app loading.
     """
     finished = pyqtSignal(list)  # [(name, icon_id, cmd, search_blob, workdir, terminal, desktop_file)]
+    partial_ready = pyqtSignal(list)  # same tuples, for the entries resolved so far (cold cache only)
 
+@functools.lru_cache(maxsize=1)
 def _locale_chain():
     """
-    Build a list of locale preferences for desktop file field selection.
+    Build the tuple of locale preferences for desktop file field selection (computed once per process).
     """
     langs = []; language = os.environ.get("LANGUAGE", "")
     if language: langs.extend([p for p in language.split(":") if p])
@@ -250,10 +333,99 @@ def _locale_chain():
         base = lang.split("_")[0]
         if base and base not in langs: langs.append(base)
     if "en" not in langs: langs.append("en")
-    seen=set(); result=[]
-    for l in langs:
-        if l not in seen: seen.add(l); result.append(l)
-    return result
+    return tuple(dict.fromkeys(langs))
+
+def _load_app_cache() -> dict:
+    """
+    Read the AppLoader cache. The first byte tags the format: b"M" msgpack, b"P" pickle.
+    """
+    try:
+        data = CACHE_FILE.read_bytes()
+    except OSError:
+        return {}
+    try:
+        tag, body = data[:1], data[1:]
+        if tag == b"M" and msgpack is not None:
+            cache = msgpack.unpackb(body, raw=False)
+        elif tag == b"P":
+            cache = pickle.loads(body)
+        else:
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+def _dump_app_cache(cache: dict) -> bytes:
+    """
+    Serialize the AppLoader cache with msgpack if available, else pickle (protocol 5).
+    """
+    if msgpack is not None:
+        return b"M" + msgpack.packb(cache, use_bin_type=True)
+    return b"P" + pickle.dumps(cache, protocol=5)
+
+def _prefetch_files(paths):
+    """
+    Ask the kernel to read `paths` into the page cache (POSIX_FADV_WILLNEED) from a daemon thread.
+    """
+    if not hasattr(os, "posix_fadvise"): return
+    paths = [p for p in paths if p]
+    if not paths: return
+    def _work():
+        for p in paths:
+            try:
+                fd = os.open(p, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    threading.Thread(target=_work, name="vifa-prefetch", daemon=True).start()
+
+# [Desktop Entry] keys kept verbatim, and keys feeding the localized search fields (key -> field)
+_DESKTOP_SCALAR_KEYS = frozenset(("Name", "Icon", "Exec", "TryExec", "Path"))
+_DESKTOP_FIELD_KEYS = {
+    "Name": "Name", "GenericName": "GenericName", "Comment": "Comment", "X-GNOME-FullName": "Name",
+    "Keywords": "Keywords", "X-GNOME-Keywords": "Keywords", "X-KDE-Keywords": "Keywords",
+}
+
+# One `Key[locale]=value` line (bytes); group headers and comments don't match
+_DESKTOP_LINE = re.compile(rb"([A-Za-z0-9-]+)(?:\[([^\]]+)\])?=(.*)")
+
+def _apply_desktop_key(key: str, val: str, scalars: dict, fields: dict):
+    """
+    Store one [Desktop Entry] key/value given the full key (`Key` or `Key[locale]`).
+    """
+    if key[-1:] == "]" and "[" in key:
+        base, loc = key[:-1].split("[", 1)
+    else:
+        base, loc = key, ""
+    _apply_desktop_field(base, loc, val, scalars, fields)
+
+def _apply_desktop_field(base: str, loc: str, val: str, scalars: dict, fields: dict):
+    """
+    Store one [Desktop Entry] value: plain keys into `scalars`, localized text into `fields`.
+    """
+    if not loc:
+        if base in _DESKTOP_SCALAR_KEYS: scalars[base] = val
+        elif base.lower() == "terminal": scalars["Terminal"] = val.strip().lower() in ("1","true","yes","on")
+    target = _DESKTOP_FIELD_KEYS.get(base)
+    if target is None: return
+    bucket = fields[target]
+    if target == "Keywords":
+        prev = bucket.get(loc)
+        bucket[loc] = f"{prev};{val}" if prev and val else (prev or val)
+    else:
+        bucket[loc] = val
+
+def _desktop_result(scalars: dict, fields: dict):
+    """
+    Flatten parser state into (name, icon, exec, try_exec, path, terminal, fields).
+    """
+    g = scalars.get
+    return g("Name"), g("Icon"), g("Exec"), g("TryExec"), g("Path"), scalars["Terminal"], fields
 
 def _remove_suffix(s: str, suffix: str) -> str:
     """
@@ -264,20 +436,25 @@ def _remove_suffix(s: str, suffix: str) -> str:
 class AppLoader(QRunnable):
     """
     Load application data from .desktop files in background.
+    When .desktop files have to be parsed, `partial_ready` is emitted once `partial_at`
+    entries are resolved, ahead of the full list in `finished`.
     """
-    def __init__(self):
+    def __init__(self, partial_at=0):
         super().__init__()
         self.s = AppLoadSignals()
+        self.partial_at = partial_at
         self.locale_pref = _locale_chain()
         self.locale_sig = "|".join(self.locale_pref)
+        self._locale_keys = (*self.locale_pref, "")
 
     @staticmethod
-    def _fingerprint(p: str):
+    def _fingerprint(p):
         """
-        Generate a fingerprint for a file based on mtime and size.
+        Generate a fingerprint for a file (path or os.DirEntry) based on mtime and size.
         """
         try:
-            st = os.stat(p); return f"{int(st.st_mtime)}:{st.st_size}"
+            st = p.stat() if isinstance(p, os.DirEntry) else os.stat(p)
+            return f"{int(st.st_mtime)}:{st.st_size}"
         except FileNotFoundError:
             return None
 
@@ -289,68 +466,70 @@ class AppLoader(QRunnable):
         if not icon_name: return None
         if os.path.isabs(icon_name):
             if os.path.exists(icon_name): return icon_name
-            for ext in ("",".png",".svg",".xpm"):
+            for ext in _ICON_EXTS:
                 p = icon_name + ext
                 if os.path.exists(p): return p
             return None
-        for base in ICON_SEARCH_PATHS:
-            if not os.path.isdir(base): continue
-            for ext in ("",".png",".svg",".xpm"):
-                candidate = os.path.join(base, icon_name + ext)
-                if os.path.exists(candidate): return candidate
-        return None
+        return _icon_index().get(icon_name)
 
-    def _read_desktop_file(self, full_path: str):
+    @staticmethod
+    def _parse_with_keyfile(full_path: str):
         """
-        Parse a .desktop file and extract relevant fields.
+        Parse the [Desktop Entry] group with GLib's GKeyFile, keeping every `Key[locale]` entry
+        (KEEP_TRANSLATIONS) so the result matches _parse_lines.
+        Returns None if GLib is unavailable or the file is rejected, so the caller can fall back.
         """
-        name_default = None; icon_name = None; cmd = None; try_exec = None
-        workdir = None; terminal = False
+        if GLib is None: return None
+        scalars = {"Terminal": False}
+        fields = {"Name": {}, "GenericName": {}, "Comment": {}, "Keywords": {}}
+        try:
+            kf = GLib.KeyFile()
+            kf.load_from_file(full_path, GLib.KeyFileFlags.KEEP_TRANSLATIONS)
+            group = "Desktop Entry"
+            if not kf.has_group(group): return None
+            keys, _n = kf.get_keys(group)
+            get = kf.get_value
+            for key in keys:
+                _apply_desktop_key(key, get(group, key), scalars, fields)
+        except Exception:  # GLib.Error on malformed files
+            return None
+        return _desktop_result(scalars, fields)
+
+    @staticmethod
+    def _parse_lines(full_path: str):
+        """
+        Pure-Python line parser for the [Desktop Entry] group; None if the file can't be read.
+        """
+        scalars = {"Terminal": False}
         fields = {"Name": {}, "GenericName": {}, "Comment": {}, "Keywords": {}}
         in_entry = False
+        match = _DESKTOP_LINE.fullmatch
         try:
-            with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
+            with open(full_path, "rb") as f:
                 for raw in f:
                     line = raw.strip()
-                    if not line or line.startswith("#"): continue
-                    if line.startswith("["):
-                        in_entry = (line.lower() == "[desktop entry]"); continue
+                    if not line: continue
+                    if line[:1] == b"[":
+                        in_entry = (line.lower() == b"[desktop entry]"); continue
                     if not in_entry: continue
-                    if line.startswith("Name="): name_default = line.split("=",1)[1]
-                    elif line.startswith("Icon="): icon_name = line.split("=",1)[1]
-                    elif line.startswith("Exec="): cmd = line.split("=",1)[1]
-                    elif line.startswith("TryExec="): try_exec = line.split("=",1)[1]
-                    elif line.startswith("Path="): workdir = line.split("=",1)[1]
-                    elif line.lower().startswith("terminal="):
-                        val = line.split("=",1)[1].strip().lower(); terminal = val in ("1","true","yes","on")
-                    for key in ("Name","GenericName","Comment"):
-                        prefix = key + "["
-                        if line.startswith(prefix) and "]=" in line:
-                            loc, val = line[len(prefix):].split("]=",1); fields[key][loc]=val
-                        elif line.startswith(key+"="):
-                            val = line.split("=",1)[1]; fields[key][""]=val
-                    xfull = "X-GNOME-FullName"; prefix = xfull+"["
-                    if line.startswith(prefix) and "]=" in line:
-                        loc, val = line[len(prefix):].split("]=",1); fields["Name"][loc]=val
-                    elif line.startswith(xfull+"="):
-                        val = line.split("=",1)[1]; fields["Name"][""]=val
-                    for kname in ("Keywords","X-GNOME-Keywords","X-KDE-Keywords"):
-                        prefix = kname+"["
-                        if line.startswith(prefix) and "]=" in line:
-                            loc, val = line[len(prefix):].split("]=",1)
-                            merged = ";".join(list(filter(None,[fields["Keywords"].get(loc,""), val])))
-                            fields["Keywords"][loc]=merged
-                        elif line.startswith(kname+"="):
-                            val = line.split("=",1)[1]
-                            merged = ";".join(list(filter(None,[fields["Keywords"].get("", ""), val])))
-                            fields["Keywords"][""]=merged
+                    m = match(line)
+                    if m is None: continue
+                    key, loc, val = m.groups()
+                    _apply_desktop_field(key.decode("ascii"), loc.decode("utf-8", "ignore") if loc else "",
+                                         val.decode("utf-8", "ignore"), scalars, fields)
         except Exception:
+            return None
+        return _desktop_result(scalars, fields)
+    def _read_desktop_file(self, full_path: str):
+        """
+        Parse a .desktop file and extract relevant fields.
+        """
+        parsed = self._parse_with_keyfile(full_path) or self._parse_lines(full_path)
+        if parsed is None:
             return None, None, None, "", None, False, full_path
-        display_name = None
-        for loc in self.locale_pref + [""]:
-            if loc in fields["Name"]:
-                display_name = fields["Name"][loc]; break
-        if not display_name: display_name = name_default
+        name_default, icon_name, cmd, try_exec, workdir, terminal, fields = parsed
+        names = fields["Name"]
+        display_name = next((names[k] for k in self._locale_keys if k in names), None) or name_default
         icon_id = None
         if icon_name:
             icon_path = self._find_icon_file(icon_name)
@@ -379,9 +558,9 @@ class AppLoader(QRunnable):
         Iterate over all directories that may contain .desktop files.
         """
         s = load_settings()
-        defaults = _DEFAULT_DESKTOP_DIRS
+        defaults = default_desktop_dirs()
         disabled = set(getattr(s, "desktop_dirs_disabled", []) or [])
-        custom = list(getattr(s, "desktop_dirs_custom", []) or [])
+        custom = tuple(getattr(s, "desktop_dirs_custom", []) or [])
         seen = set()
         for p in defaults + custom:
             if not p or p in disabled or p in seen: continue
@@ -391,86 +570,117 @@ class AppLoader(QRunnable):
         """
         Load and cache application data.
         """
-        cache = {}
-        if CACHE_FILE.exists():
-            try:
-                cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
-            except Exception:
-                cache = {}
-        apps = {}
+        cache = _load_app_cache()
         changed = False
+        # Collect every entry first; cache hits resolve inline, misses are parsed in parallel.
+        found = []
         for path in self._iter_effective_dirs():
-            if not os.path.isdir(path):
+            try:
+                with os.scandir(path) as it:
+                    dir_entries = [e for e in it if e.name.lower().endswith(".desktop") and e.is_file()]
+            except OSError:
                 continue
-            it = QDirIterator(path, ["*.desktop"], QDir.Files, QDirIterator.NoIteratorFlags)
-            while it.hasNext():
-                full_path = it.next()
-                fp = self._fingerprint(full_path)
+            for de in dir_entries:
+                full_path = de.path
+                fp = self._fingerprint(de)
                 entry = cache.get(full_path)
-                name = icon_id = cmd = search_blob = workdir = None
-                terminal = False
-                need_reparse = True
-                if entry and entry.get("fp") == fp:
-                    if (entry.get("search_blob")
-                        and entry.get("loc") == self.locale_sig
-                        and entry.get("ver") == CACHE_SCHEMA_VERSION
-                        and bool(entry.get("idx_all")) is True
-                        and bool(entry.get("acc_fold")) is True):
-                        name = entry.get("name")
-                        cmd = entry.get("cmd")
-                        icon_id = entry.get("icon_id")
-                        search_blob = entry.get("search_blob", "")
-                        workdir = entry.get("workdir")
-                        terminal = bool(entry.get("terminal", False))
-                        need_reparse = False
-                if need_reparse:
-                    name, icon_id, cmd, search_blob, workdir, terminal, _df = self._read_desktop_file(full_path)
-                    if name and cmd:
-                        changed = True
-                        cache[full_path] = {
-                            "fp": fp, "name": name, "cmd": cmd, "icon_id": icon_id, "search_blob": search_blob,
-                            "workdir": workdir, "terminal": terminal,
-                            "loc": self.locale_sig, "ver": CACHE_SCHEMA_VERSION, "idx_all": True, "acc_fold": True,
-                        }
+                if (entry and entry.get("fp") == fp
+                    and entry.get("search_blob")
+                    and entry.get("loc") == self.locale_sig
+                    and entry.get("ver") == CACHE_SCHEMA_VERSION
+                    and bool(entry.get("idx_all")) is True
+                    and bool(entry.get("acc_fold")) is True):
+                    found.append((full_path, fp, entry))
+                else:
+                    found.append((full_path, fp, None))
+        pending = [full_path for full_path, _fp, entry in found if entry is None]
+        parsed = {}
+        if pending:
+            from concurrent.futures import ThreadPoolExecutor  # deferred: pulls in logging, only needed on cache misses
+            # Stream a first batch to the UI once enough entries are resolved (pool.map yields in order)
+            partial_at = self.partial_at; ready = len(found) - len(pending)
+            workers = min(16, 2 * (os.cpu_count() or 1), len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for full_path, res in zip(pending, pool.map(self._read_desktop_file, pending)):
+                    parsed[full_path] = res
+                    if partial_at and ready + len(parsed) >= partial_at and len(parsed) < len(pending):
+                        partial_at = 0
+                        self.s.partial_ready.emit(self._app_list(found, parsed))
+        for full_path, fp, entry in found:
+            if entry is None:
+                name, icon_id, cmd, search_blob, workdir, terminal, _df = parsed[full_path]
                 if name and cmd:
-                    key = f"{name}:{cmd}"
-                    if key not in apps:
-                        apps[key] = (name, icon_id, cmd, search_blob, workdir, terminal, full_path)
+                    changed = True
+                    cache[full_path] = {
+                        "fp": fp, "name": name, "cmd": cmd, "icon_id": icon_id, "search_blob": search_blob,
+                        "workdir": workdir, "terminal": terminal,
+                        "loc": self.locale_sig, "ver": CACHE_SCHEMA_VERSION, "idx_all": True, "acc_fold": True,
+                    }
         if changed:
             try:
                 CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-                CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+                CACHE_FILE.write_bytes(_dump_app_cache(cache))
             except Exception:
                 pass
-        app_list = sorted(apps.values(), key=lambda x: (x[0] or "").lower())
-        self.s.finished.emit(app_list)
+        self.s.finished.emit(self._app_list(found, parsed))
+
+    @staticmethod
+    def _app_list(found, parsed):
+        """
+        Build the de-duplicated, name-sorted app tuples from cache hits and the entries parsed so far.
+        """
+        apps = {}
+        for full_path, _fp, entry in found:
+            if entry is not None:
+                name = entry.get("name")
+                cmd = entry.get("cmd")
+                icon_id = entry.get("icon_id")
+                search_blob = entry.get("search_blob", "")
+                workdir = entry.get("workdir")
+                terminal = bool(entry.get("terminal", False))
+            else:
+                res = parsed.get(full_path)
+                if res is None: continue
+                name, icon_id, cmd, search_blob, workdir, terminal, _df = res
+            if name and cmd:
+                key = f"{name}:{cmd}"
+                if key not in apps:
+                    apps[key] = (name, icon_id, cmd, search_blob, workdir, terminal, full_path)
+        return sorted(apps.values(), key=lambda x: (x[0] or "").lower())
 
 def _trim_alpha_borders(pix: QPixmap) -> QPixmap:
     """
     Trim transparent borders from a QPixmap.
     """
     if pix.isNull(): return pix
+    import numpy as np  # deferred: only needed once icons are rasterized
     img = pix.toImage().convertToFormat(QImage.Format_ARGB32)
     w, h = img.width(), img.height()
     if w == 0 or h == 0: return pix
     ptr = img.bits(); ptr.setsize(img.byteCount())
     arr = np.frombuffer(ptr, dtype=np.uint8).reshape(h, img.bytesPerLine())
-    alpha = arr[:, 3:3 + 4 * w:4]
-    rows = np.where(alpha.max(axis=1) > 0)[0]
-    cols = np.where(alpha.max(axis=0) > 0)[0]
-    if rows.size == 0 or cols.size == 0: return pix
-    top, bottom = int(rows[0]), int(rows[-1])
-    left, right = int(cols[0]), int(cols[-1])
+    alpha = np.ascontiguousarray(arr[:, 3:3 + 4 * w:4])
+    row_any = alpha.any(axis=1)
+    if not row_any.any(): return pix
+    col_any = alpha.any(axis=0)
+    top, bottom = int(row_any.argmax()), h - 1 - int(row_any[::-1].argmax())
+    left, right = int(col_any.argmax()), w - 1 - int(col_any[::-1].argmax())
     return pix.copy(left, top, right - left + 1, bottom - top + 1)
 
 def _rasterize_icon_uniform(icon: QIcon, size: int) -> QIcon:
     """
     Rasterize an icon to a uniform size, preserving aspect ratio and trimming transparent borders.
+    Icons that ship a bitmap of exactly `size` skip the 2x upscale and trim, but are still
+    painted into the same margin box so every icon ends up with the same geometry.
     """
     if icon.isNull(): return icon
-    base = icon.pixmap(size * 2, size * 2)
-    if base.isNull(): return icon
-    cropped = _trim_alpha_borders(base)
+    if QSize(size, size) in icon.availableSizes():
+        cropped = icon.pixmap(size, size)
+    else:
+        base = icon.pixmap(size * 2, size * 2)
+        if base.isNull(): return icon
+        cropped = _trim_alpha_borders(base)
+    if cropped.isNull(): return icon
     target = QPixmap(size, size); target.fill(Qt.transparent)
     painter = QPainter(target); painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
     try:
@@ -487,6 +697,75 @@ def _rasterize_icon_uniform(icon: QIcon, size: int) -> QIcon:
         painter.end()
     return QIcon(target)
 
+@functools.lru_cache(maxsize=1024)
+def _cached_rasterize(icon_path: str, size: int) -> QIcon:
+    """
+    Rasterize an icon file like _rasterize_icon_uniform, keeping the result as a PNG
+    in ICON_CACHE_DIR keyed by (render version, path, mtime, size) so later launches skip the pipeline.
+    Memoized per (icon_path, size), so icon IDs resolving to the same file share one QIcon.
+    Hits refresh the PNG's mtime, which _prune_icon_cache uses as its LRU order.
+    """
+    try:
+        st = os.stat(icon_path)
+    except OSError:
+        return _rasterize_icon_uniform(QIcon(icon_path), size)
+    key = hashlib.blake2b(f"{ICON_RENDER_VERSION}|{icon_path}|{st.st_mtime_ns}|{size}".encode(), digest_size=12).hexdigest()
+    cache_path = str(ICON_CACHE_DIR / f"{key}.png")
+    pm = QPixmap(cache_path)
+    if not pm.isNull():
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return QIcon(pm)
+    icon = _rasterize_icon_uniform(QIcon(icon_path), size)
+    tmp = cache_path + ".tmp"
+    try:
+        pm = icon.pixmap(size, size)
+        if not pm.isNull():
+            ICON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            if pm.save(tmp, "PNG"): os.replace(tmp, cache_path)
+            else: os.unlink(tmp)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return icon
+
+def _prune_icon_cache(max_bytes: int = ICON_CACHE_MAX_BYTES):
+    """
+    Keep ICON_CACHE_DIR under `max_bytes` from a daemon thread: evict the least recently used PNGs
+    (down to 3/4 of the cap, so pruning does not run on every launch) and drop stale .tmp files.
+    Each unlink is atomic, so a prune cut short when the launcher quits leaves a valid cache.
+    """
+    def _work():
+        entries = []; total = 0; stale_tmp = time.time() - 3600
+        try:
+            with os.scandir(ICON_CACHE_DIR) as it:
+                for e in it:
+                    try:
+                        st = e.stat()
+                        if e.name.endswith(".tmp"):
+                            if st.st_mtime < stale_tmp: os.unlink(e.path)  # newer ones may still be written
+                            continue
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, e.path)); total += st.st_size
+        except OSError:
+            return
+        if total <= max_bytes: return
+        entries.sort()
+        target = max_bytes * 3 // 4
+        for _mtime, size, path in entries:
+            if total <= target: break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+    threading.Thread(target=_work, name="vifa-icon-prune", daemon=True).start()
+
 def _draw_placeholder_icon(size: int) -> QIcon:
     """
     Draw a placeholder icon (a square with an X).
@@ -519,50 +798,76 @@ def _fallback_icon() -> QIcon:
         return ico
     return _draw_placeholder_icon(64)
 
+@functools.lru_cache(maxsize=8)
+def _fallback_icon_uniform(size: int) -> QIcon:
+    """
+    The rasterized fallback icon, shared by every unresolvable icon ID of this size.
+    """
+    return _rasterize_icon_uniform(_fallback_icon(), size)
+
+def _clear_icon_caches():
+    """
+    Drop all memoized rasterized icons (e.g. after the icon size changed).
+    Resolved icon sources (_resolve_icon) are size-independent and kept.
+    """
+    _icon_from_id.cache_clear(); _cached_rasterize.cache_clear(); _fallback_icon_uniform.cache_clear()
+
+@functools.lru_cache(maxsize=4096)
 def _icon_is_resolvable(icon_id, use_theme_fallback=True):
     """
     Check if an icon ID can be resolved to an actual icon file or theme icon.
+    Memoized per (icon_id, use_theme_fallback); cleared with the icon index.
     """
     if not icon_id:
         return False
     if os.path.isabs(icon_id):
         if os.path.exists(icon_id): return True
-        for ext in ("",".png",".svg",".xpm"):
+        for ext in _ICON_EXTS:
             if os.path.exists(icon_id+ext): return True
         return False
-    for base in ICON_SEARCH_PATHS:
-        if not os.path.isdir(base): continue
-        for ext in ("",".png",".svg",".xpm"):
-            cand = os.path.join(base, icon_id+ext)
-            if os.path.exists(cand): return True
+    if icon_id in _icon_index(): return True
     if use_theme_fallback and "/" not in (icon_id or ""):
         if QIcon.hasThemeIcon(icon_id): return True
         ic = QIcon.fromTheme(icon_id)
         if not ic.isNull(): return True
     return False
 
-def _icon_from_id(icon_id, size, use_theme_fallback=True) -> QIcon:
+@functools.lru_cache(maxsize=2048)
+def _resolve_icon(icon_id, use_theme_fallback=True):
     """
-    Load an icon from an ID, falling back to a placeholder if necessary.
+    Resolve an icon ID to its source: an icon file path (str), a QIcon, or None (use the fallback).
+    Size-independent, so the lookup and QIcon survive icon-size changes.
     """
     if not icon_id:
-        return _rasterize_icon_uniform(_fallback_icon(), size)
+        return None
     if os.path.isabs(icon_id) and os.path.exists(icon_id):
-        return _rasterize_icon_uniform(QIcon(icon_id), size)
+        return icon_id
     icon = QIcon.fromTheme(icon_id) if use_theme_fallback else QIcon()
-    if icon.isNull():
-        if os.path.exists(icon_id):
-            icon = QIcon(icon_id)
-    if icon.isNull():
-        for base in ICON_SEARCH_PATHS:
-            for ext in ("",".png",".svg",".xpm"):
-                p = os.path.join(base, icon_id+ext)
-                if os.path.exists(p):
-                    icon = QIcon(p); break
-            if not icon.isNull(): break
-    if icon.isNull():
-        icon = _fallback_icon()
-    return _rasterize_icon_uniform(icon, size)
+    if not icon.isNull():
+        return icon
+    if os.path.exists(icon_id):
+        icon = QIcon(icon_id)
+        if not icon.isNull(): return icon
+    return _icon_index().get(icon_id)
+
+def _invalidate_icon_index():
+    """
+    Forget the icon directory index and everything resolved through it.
+    """
+    _icon_index.cache_clear(); _resolve_icon.cache_clear(); _icon_is_resolvable.cache_clear()
+
+@functools.lru_cache(maxsize=2048)
+def _icon_from_id(icon_id, size, use_theme_fallback=True) -> QIcon:
+    """
+    Load an icon from an ID, falling back to a placeholder if necessary.
+    Memoized per (icon_id, size, use_theme_fallback).
+    """
+    src = _resolve_icon(icon_id, use_theme_fallback)
+    if src is None:
+        return _fallback_icon_uniform(size)
+    if isinstance(src, str):
+        return _cached_rasterize(src, size)
+    return _rasterize_icon_uniform(src, size)
 
 class SearchLineEdit(QLineEdit):
     """
@@ -598,10 +903,11 @@ class SearchLineEdit(QLineEdit):
 class AppIcon(QPushButton):
     """
     Button representing an application icon.
+    The icon is rasterized lazily on first paint (memoized by _icon_from_id).
     """
-    def __init__(self, icon: QIcon, command: str, launcher, icon_size: int):
+    def __init__(self, icon_id, command: str, launcher, icon_size: int, use_theme_fallback: bool = True):
         super().__init__()
-        self.setIcon(icon)
+        self._pending_icon = (icon_id, icon_size, use_theme_fallback)
         self.setIconSize(QSize(icon_size, icon_size))
         self.setFixedSize(icon_size + 10, icon_size + 10)
         self.setFocusPolicy(Qt.NoFocus)
@@ -611,6 +917,24 @@ class AppIcon(QPushButton):
         self.setStyleSheet(APP_ICON_QSS)
         self._launch_meta = {}
 
+    def _ensure_icon(self):
+        """
+        Rasterize and set the deferred icon, once.
+        """
+        if self._pending_icon is not None:
+            icon_id, size, use_theme_fallback = self._pending_icon
+            self._pending_icon = None
+            self.setIcon(_icon_from_id(icon_id, size, use_theme_fallback=use_theme_fallback))
+
+    def icon(self):
+        # Transitions read icons of pages that have not been painted yet
+        self._ensure_icon()
+        return super().icon()
+
+    def paintEvent(self, e):
+        self._ensure_icon()
+        super().paintEvent(e)
+
     def launch(self):
         """
         Launch the application associated with this icon.
@@ -623,39 +947,78 @@ class AppIcon(QPushButton):
                                  icon_id=meta.get("icon_id"),
                                  desktop_file_path=meta.get("desktop_file_path"))
 
-# --- Helper for RichText label with robust line breaking ---
-def _label_html(text: str) -> str:
+class PageDot(QLabel):
+    """
+    Page indicator dot; emits its page index when clicked.
+    """
+    clicked = pyqtSignal(int)
+
+    def __init__(self, page: int, parent=None):
+        super().__init__("●", parent)
+        self.page = page
+        self.setStyleSheet(DOT_QSS_INACTIVE)
+
+    def mousePressEvent(self, event):
+        self.clicked.emit(self.page)
+
+class ContentLabel(QLabel):
+    """
+    Label that consumes mouse presses, so a click on it is not taken as a click outside the content.
+    """
+    def mousePressEvent(self, event):
+        event.accept()
+
+class BgScaleSignals(QObject):
+    """
+    Signals for asynchronous background scaling.
+    """
+    finished = pyqtSignal(int, QImage)  # (generation, scaled and dimmed image)
+
+class BgScaleWorker(QRunnable):
     """
-    Convert text to HTML with robust line breaking and centering.
+    Scale and dim the background image off the UI thread.
     """
-    safe = html.escape(text or "")
-    return (
-        "<div style='text-align:center;"
-        "overflow-wrap:anywhere;word-wrap:break-word;word-break:break-word;"
-        "white-space:normal;'>"
-        f"{safe}</div>"
-    )
+    def __init__(self, generation: int, source: QImage, size, dim_alpha: int):
+        super().__init__()
+        self.s = BgScaleSignals()
+        self.generation = generation; self.source = source
+        self.size = size; self.dim_alpha = dim_alpha
+
+    def run(self):
+        w, h = self.size
+        img = self.source.scaled(w, h, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        if self.dim_alpha > 0:
+            painter = QPainter(img)
+            painter.fillRect(img.rect(), QColor(0,0,0, self.dim_alpha))
+            painter.end()
+        self.s.finished.emit(self.generation, img)
+
+# Wallpaper sync command; it runs detached so it can outlive the launcher
+_WALLPAPER_PY = sys.executable or "python3"
+_WALLPAPER_ARGS = ("-m", "vifa_launcher.wallpaper_sync")
 
 class AppLauncher(QDialog):
     """
     Main application launcher dialog.
     """
-    # --- Helpers: cache-busting pixmap load & swap to wp-o.jpg ---
-    def _load_pixmap_nocache(self, path: str) -> QPixmap:
+    # --- Helpers: cache-busting image load & swap to wp-o.jpg ---
+    def _load_image_nocache(self, path: str) -> QImage:
         """
-        Load a pixmap, bypassing the cache.
+        Load an image bypassing the cache, converted to Format_ARGB32_Premultiplied
+        (the raster engine's fastest format for scaling and blending).
         """
         try:
             f = QFile(path)
             if not f.open(QIODevice.ReadOnly):
-                return QPixmap()
+                return QImage()
             data = f.readAll()
             f.close()
-            pm = QPixmap()
-            pm.loadFromData(data)
-            return pm
+            img = QImage.fromData(data)
+            if img.isNull():
+                return img
+            return img.convertToFormat(QImage.Format_ARGB32_Premultiplied)
         except Exception:
-            return QPixmap()
+            return QImage()
 
     def _swap_to_wp_o_if_ready(self, readd=None):
         """
@@ -667,6 +1030,7 @@ class AppLauncher(QDialog):
                 self._bg_path = prefer
                 self._bg_source = None
                 self._bg_file_mtime = None
+                self._watch_bg_path()
                 self._update_background(force=True)
             if callable(readd):
                 readd()
@@ -679,21 +1043,26 @@ class AppLauncher(QDialog):
         self.setObjectName("Launcher")
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setWindowState(Qt.WindowFullScreen)
+        # Warm the page cache for the app cache while the widgets are built
+        _prefetch_files([str(CACHE_FILE)])
+        # Trim the rasterized icon cache once startup work has settled
+        QTimer.singleShot(3000, _prune_icon_cache)
         s = load_settings()
-        self.bg_mode = getattr(s, "background_mode", BACKGROUND_MODE_WP)
-        self.bg_custom_path = getattr(s, "background_custom_path", "") or ""
-        self.bg_color_str = getattr(s, "background_color", "#202020")
-        self.only_resolvable = bool(getattr(s, "filter_only_apps_with_icon", False))
-        self.use_theme_fallback = bool(getattr(s, "use_theme_fallback", True))
-        self.page_size = int(getattr(s, "page_size", 35))
-        the_icons_per_row = int(getattr(s, "icons_per_row", 7))
-        self.icons_per_row = max(1, the_icons_per_row)
-        self.icon_size = int(getattr(s, "icon_size", 115))
-        self.grid_lr = int(getattr(s, "grid_margins_lr", 200))
-        self.font_family = str(getattr(s, "font_family", ""))
-        self.font_pt = int(getattr(s, "font_point_size", 12))
-        self.font_color = str(getattr(s, "font_color", "#FFFFFF"))
-        self.wheel_sensitivity = float(getattr(s, "wheel_sensitivity", 1.0))
+        self._last_applied_settings = s  # open_settings skips re-applying an unchanged Settings
+        # Settings is a validated slots dataclass: numeric fields are already clamped ints/floats.
+        self.bg_mode = s.background_mode
+        self.bg_custom_path = s.background_custom_path
+        self.bg_color_str = s.background_color
+        self.only_resolvable = bool(s.filter_only_apps_with_icon)
+        self.use_theme_fallback = bool(s.use_theme_fallback)
+        self.page_size = s.page_size
+        self.icons_per_row = max(1, s.icons_per_row)
+        self.icon_size = s.icon_size
+        self.grid_lr = s.grid_margins_lr
+        self.font_family = str(s.font_family)
+        self.font_pt = s.font_point_size
+        self.font_color = str(s.font_color)
+        self.wheel_sensitivity = s.wheel_sensitivity
         self.runtime_paths = get_runtime_paths()
         # --- Watch wp-o.jpg for instant swap ---
         try:
@@ -718,17 +1087,29 @@ class AppLauncher(QDialog):
             self._fsw.fileChanged.connect(_on_wp_o_changed)
         except Exception:
             pass
-        # Background state
+        # --- Rebuild the icon index when an icon directory changes ---
+        try:
+            self._icon_dirs_fsw = QFileSystemWatcher([p for p in ICON_SEARCH_PATHS if os.path.isdir(p)], self)
+            self._icon_dirs_fsw.directoryChanged.connect(lambda _p: self._on_icon_dirs_changed())
+        except Exception:
+            pass
+        # Background state; the file and its directory are watched (inotify) instead of polled
         self._bg_use_color = None
         self._bg_path = None
         self._bg_file_mtime = None
+        self._bg_fsw = QFileSystemWatcher(self)
+        self._bg_change_timer = QTimer(self)
+        self._bg_change_timer.setSingleShot(True)
+        self._bg_change_timer.setInterval(0)
+        self._bg_change_timer.timeout.connect(self._on_bg_path_changed)
+        self._bg_fsw.fileChanged.connect(lambda _p: self._bg_change_timer.start())
+        self._bg_fsw.directoryChanged.connect(lambda _p: self._bg_change_timer.start())
         self._choose_background_from_settings(s)
         self._bg_source = None
         self._bg_scaled_for = None
+        self._bg_generation = 0
         # Background dimming from settings
-        self._bg_dim_alpha = int(getattr(s, "background_dim_alpha", 80))
-        # First update (safe - does nothing if background_label is missing)
-        self._update_background(force=True)
+        self._bg_dim_alpha = s.background_dim_alpha
         # Content/UI
         self.content = QWidget(self)
         self.content.setObjectName("content")
@@ -738,29 +1119,43 @@ class AppLauncher(QDialog):
         self.background_label.setGeometry(0, 0, self.width(), self.height())
         self.background_label.setScaledContents(True)
         self.background_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self._bg_resize_timer = QTimer(self)
+        self._bg_resize_timer.setSingleShot(True)
+        self._bg_resize_timer.setInterval(60)
+        self._bg_resize_timer.timeout.connect(self._update_background)
         self._update_background(force=True)
-        self._bg_watch_timer = QTimer(self)
-        self._bg_watch_timer.setInterval(800)
-        self._bg_watch_timer.timeout.connect(self._bg_tick_watch)
-        self._bg_watch_timer.start()
         self.apps = []
+        self._doc_norm = []
+        self._resolvable = None  # (use_theme_fallback, per-app flags), see _resolvable_mask()
         self.filtered_apps = []
         self.current_page = 0
         self._total = 0
         self._total_pages = 0
-        self._built_pages = set()
+        self._built_pages = {}  # page -> _page_key() it was built for
+        self._active_dot = -1
+        self._page_dot_widgets = ()  # PageDot widgets in page order, see _rebuild_page_dot_cache()
+        self._stack_pages = []  # logical page numbers, in stack order (sorted)
+        self._label_h_cache = {}  # (label text, width, font family, point size) -> label height
         self.selected_icon_index = -1
         self.selection_mode = False
         self._page_busy = False
+        self._prewarm_pending = False  # a neighbor-page prewarm is already queued
         self._gesture_timer = QElapsedTimer()
         self._gesture_timer.invalidate()
         self._gesture_dir = 0
+        self._close_click_timer = QElapsedTimer()  # debounces close-on-click-outside, see mousePressEvent
+        self._close_click_timer.invalidate()
         layout = QVBoxLayout(self.content)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(10)
         self.search_bar = SearchLineEdit()
         self.search_bar.setPlaceholderText("Search programs...")
-        self.search_bar.textChanged.connect(self.filter_apps)
+        # Filtering is debounced so a burst of keystrokes rebuilds the grid once
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(lambda: self.filter_apps(self.search_bar.text()))
+        self.search_bar.textChanged.connect(self._filter_timer.start)
         self.search_bar.textChanged.connect(self._on_search_text_changed)
         self.search_bar.setStyleSheet("""
             QLineEdit {
@@ -779,6 +1174,7 @@ class AppLauncher(QDialog):
         self.search_bar.arrowRight.connect(self._on_search_arrow_right)
         self.search_bar.enterPressed.connect(self._on_search_enter)
         self.stack = AnimatedStackedWidget()
+        self.stack.animation_finished.connect(self._on_page_animation_finished)
         self.stack.installEventFilter(self)
         layout.addWidget(self.stack)
         self._make_transparent(self.stack)
@@ -787,7 +1183,7 @@ class AppLauncher(QDialog):
         self.page_dots_layout.setSpacing(8)
         self.page_dots_layout.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.page_dots_holder)
-        self.loading_label = QLabel("Loading apps...")
+        self.loading_label = ContentLabel("Loading apps...")
         self.loading_label.setStyleSheet("color: white; font-size: 16px;")
         loading_holder = QWidget()
         hl = QVBoxLayout(loading_holder)
@@ -796,7 +1192,7 @@ class AppLauncher(QDialog):
         self.stack.addWidget(loading_holder)
         QApplication.instance().installEventFilter(self)
         self._settings_shortcut = None
-        self._install_settings_shortcut(getattr(s, "settings_shortcut", "Ctrl+,"))
+        self._install_settings_shortcut(s.settings_shortcut)
         self.fx_curtain = QWidget(self)
         self.fx_curtain.setAutoFillBackground(True)
         pal = self.fx_curtain.palette()
@@ -807,7 +1203,8 @@ class AppLauncher(QDialog):
         self.fx_overlay.setScaledContents(True)
         self.fx_overlay.hide()
         self.threadpool = QThreadPool.globalInstance()
-        loader = AppLoader()
+        loader = AppLoader(partial_at=self.page_size * 2)
+        loader.s.partial_ready.connect(self._on_apps_partial)
         loader.s.finished.connect(self._on_apps_loaded)
         self.threadpool.start(loader)
         self._run_wallpaper_sync_once()
@@ -833,21 +1230,22 @@ class AppLauncher(QDialog):
         self.content.ensurePolished()
         self.content.repaint()
         QCoreApplication.processEvents()
+        def _is_blank(pm):
+            # Fully transparent premultiplied ARGB is all zero bytes: one memcmp instead of a pixel probe
+            if pm.isNull(): return True
+            img = pm.toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+            n = img.byteCount(); ptr = img.constBits(); ptr.setsize(n)
+            return ptr.asstring(n) == bytes(n)
         def _do_render():
-            shot = QPixmap(self.size())
-            shot.fill(Qt.transparent)
-            self.content.render(shot)
-            if shot.isNull() or shot.toImage().allGray() and shot.toImage().pixelColor(0,0).alpha() == 0:
+            shot = self.content.grab(self.rect())
+            if _is_blank(shot):
                 self.content.show()
                 self.content.repaint()
                 QCoreApplication.processEvents()
                 self.content.hide()
                 self.content.repaint()
                 QCoreApplication.processEvents()
-                shot2 = QPixmap(self.size())
-                shot2.fill(Qt.transparent)
-                self.content.render(shot2)
-                shot = shot2
+                shot = self.content.grab(self.rect())
             self.fx_overlay.setPixmap(shot)
             self.fx_overlay.setGeometry(self.rect())
             self.fx_overlay.show()
@@ -877,11 +1275,20 @@ class AppLauncher(QDialog):
         """
         self.search_bar.route_lr_to_launcher = (len(text.strip()) == 0)
 
+    def _flush_pending_filter(self):
+        """
+        Apply a debounced filter right away (before acting on the filtered list).
+        """
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self.filter_apps(self.search_bar.text())
+
     def _on_search_arrow_down(self):
         """
         Handle down arrow key in search bar.
         """
         self.search_bar.route_lr_to_launcher = True
+        self._flush_pending_filter()
         if not self.filtered_apps:
             return
         if not self.selection_mode:
@@ -929,6 +1336,7 @@ class AppLauncher(QDialog):
         """
         Handle enter key in search bar.
         """
+        self._flush_pending_filter()
         if self.selection_mode:
             self.launch_selected()
 
@@ -955,33 +1363,55 @@ class AppLauncher(QDialog):
             self._bg_use_color = None
             self._bg_path = str(self.runtime_paths["wp"])
             self._bg_file_mtime = None
+        self._watch_bg_path()
 
-    def _install_settings_shortcut(self, seq_str: str):
+    def _watch_bg_path(self):
         """
-        Install or update the settings shortcut.
+        Point the background watcher at the current background file and its directory.
         """
-        if getattr(self, "_settings_shortcut", None) is not None:
-            try: self._settings_shortcut.setParent(None)
-            except Exception: pass
-            self._settings_shortcut = None
+        fsw = getattr(self, "_bg_fsw", None)
+        if fsw is None: return
         try:
-            sc = QShortcut(QKeySequence(seq_str), self)
+            old = fsw.files() + fsw.directories()
+            if old: fsw.removePaths(old)
+            if self._bg_use_color is None and self._bg_path:
+                d = os.path.dirname(self._bg_path)
+                if d and os.path.isdir(d): fsw.addPath(d)
+                if os.path.exists(self._bg_path): fsw.addPath(self._bg_path)
         except Exception:
-            sc = QShortcut(QKeySequence("Ctrl+,"), self)
-        sc.setContext(Qt.ApplicationShortcut)
-        sc.activated.connect(self.open_settings)
-        self._settings_shortcut = sc
+            pass
 
-    def _bg_tick_watch(self):
+    def _on_bg_path_changed(self):
         """
-        Periodically check if the background image has changed.
+        Debounced handler for watcher events: re-arm the watch (atomic replaces drop it) and
+        reload if the background file itself changed (directory events also fire for siblings).
         """
+        self._watch_bg_path()
         if self._bg_use_color is not None: return
         old = self._bg_file_mtime
         self._load_bg_source()
         if self._bg_file_mtime and old != self._bg_file_mtime:
             self._update_background(force=True)
 
+    def _install_settings_shortcut(self, seq_str: str):
+        """
+        Install the settings shortcut, or rebind the existing one to `seq_str`.
+        """
+        try:
+            seq = QKeySequence(seq_str)
+        except Exception:
+            seq = QKeySequence()
+        if seq.isEmpty():
+            seq = QKeySequence("Ctrl+,")
+        sc = self._settings_shortcut
+        if sc is not None:
+            if sc.key() != seq: sc.setKey(seq)
+            return
+        sc = QShortcut(seq, self)
+        sc.setContext(Qt.ApplicationShortcut)
+        sc.activated.connect(self.open_settings)
+        self._settings_shortcut = sc
+
     def _load_bg_source(self):
         """
         Load the background image or color.
@@ -996,9 +1426,9 @@ class AppLauncher(QDialog):
             mtime = None
         need_reload = (self._bg_source is None) or (mtime is not None and mtime != self._bg_file_mtime)
         if need_reload:
-            pm = self._load_pixmap_nocache(self._bg_path)
-            if not pm.isNull():
-                self._bg_source = pm; self._bg_file_mtime = mtime
+            img = self._load_image_nocache(self._bg_path)
+            if not img.isNull():
+                self._bg_source = img; self._bg_file_mtime = mtime
             else:
                 self._bg_source = None
 
@@ -1006,13 +1436,10 @@ class AppLauncher(QDialog):
         """
         Update the background pixmap, applying dimming if configured.
         """
-        try:
-            QPixmapCache.clear()
-        except Exception:
-            pass
         if not hasattr(self, "background_label"):
             return
         if self._bg_use_color is not None:
+            self._bg_generation += 1  # drop any in-flight BgScaleWorker result
             pm = QPixmap(self.size()); pm.fill(self._bg_use_color)
             self.background_label.setPixmap(pm)
             self.background_label.setGeometry(0,0,self.width(), self.height())
@@ -1020,6 +1447,7 @@ class AppLauncher(QDialog):
             return
         self._load_bg_source()
         if self._bg_source is None:
+            self._bg_generation += 1
             pm = QPixmap(self.size()); pm.fill(QColor(20,20,20))
             self.background_label.setPixmap(pm)
             self.background_label.setGeometry(0,0,self.width(), self.height())
@@ -1028,15 +1456,33 @@ class AppLauncher(QDialog):
         if self.width() <=0 or self.height() <=0: return
         size_key = (self.width(), self.height())
         if not force and getattr(self, "_bg_scaled_for", None) == size_key: return
-        scaled = self._bg_source.scaled(self.size(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
-        painter = QPainter(scaled)
-        if self._bg_dim_alpha > 0:
-            painter.fillRect(scaled.rect(), QColor(0,0,0, self._bg_dim_alpha))
-        painter.end()
-        self.background_label.setPixmap(scaled)
-        self.background_label.setGeometry(0,0,self.width(), self.height())
+        # Smooth scaling a large wallpaper is slow: do it on the pool, newest request wins
+        self._bg_generation += 1
+        worker = BgScaleWorker(self._bg_generation, self._bg_source, size_key, self._bg_dim_alpha)
+        worker.s.finished.connect(self._on_bg_scaled)
+        QThreadPool.globalInstance().start(worker)
         self._bg_scaled_for = size_key
 
+    def _update_background_fast(self):
+        """
+        Interim background for live resizes: a Qt.FastTransformation scale of the (already dimmed)
+        pixmap on screen, so the label does not smooth-scale it on every frame.
+        """
+        pm = self.background_label.pixmap()
+        w, h = self.width(), self.height()
+        if pm is None or pm.isNull() or w <= 0 or h <= 0: return
+        if (pm.width(), pm.height()) == (w, h): return
+        self.background_label.setPixmap(pm.scaled(w, h, Qt.IgnoreAspectRatio, Qt.FastTransformation))
+
+    def _on_bg_scaled(self, generation: int, img: QImage):
+        """
+        Install a background scaled by BgScaleWorker unless a newer request or resize superseded it.
+        """
+        if generation != self._bg_generation: return
+        if (img.width(), img.height()) != (self.width(), self.height()): return
+        self.background_label.setPixmap(QPixmap.fromImage(img))
+        self.background_label.setGeometry(0,0,self.width(), self.height())
+
     def _make_transparent(self, w: QWidget):
         """
         Make a widget transparent.
@@ -1046,7 +1492,10 @@ class AppLauncher(QDialog):
         w.setStyleSheet("background: transparent;")
 
     def resizeEvent(self, e):
-        self._update_background()
+        # Rescale the background smoothly once the resize settles; meanwhile use a cheap nearest-neighbour copy
+        self.background_label.setGeometry(0, 0, self.width(), self.height())
+        self._update_background_fast()
+        self._bg_resize_timer.start()
         self.content.setGeometry(self.rect())
         if self.fx_curtain.isVisible():
             self.fx_curtain.setGeometry(self.rect())
@@ -1054,93 +1503,196 @@ class AppLauncher(QDialog):
             self.fx_overlay.setGeometry(self.rect())
         super().resizeEvent(e)
 
-    def _on_apps_loaded(self, apps):
+    def _on_apps_partial(self, apps):
+        """
+        Called with the first batch of apps while the loader is still parsing .desktop files.
+        """
+        if apps and not self.apps:
+            self._on_apps_loaded(apps, partial=True)
+
+    def _on_apps_loaded(self, apps, partial=False):
         """
-        Called when the list of apps is loaded.
+        Called when the list of apps is loaded (or, with `partial`, its first batch).
+        A partial batch is shown but not search-indexed (filter_apps indexes it on demand);
+        the full list is indexed and reconciled in place: unchanged pages are kept.
         """
-        if self.only_resolvable:
-            self.apps = [a for a in apps if _icon_is_resolvable(a[1], use_theme_fallback=self.use_theme_fallback)]
+        first = not self.apps
+        if not first and apps == self.apps:
+            if not partial and self._doc_norm is None: self._index_search_docs()
+            return
+        self.apps = apps
+        self._resolvable = None
+        if partial: self._doc_norm = None
+        else: self._index_search_docs()
+        query = self.search_bar.text()
+        if query.strip():
+            self.filter_apps(query)
         else:
-            self.apps = apps
-        self.filtered_apps = self.apps
-        self._build_dots_and_placeholders()
-        self.switch_page(0, animate=False)
-        QTimer.singleShot(0, self._start_intro_fx)
+            if self.only_resolvable:
+                self.filtered_apps = [a for a, ok in zip(apps, self._resolvable_mask()) if ok]
+            else:
+                self.filtered_apps = apps
+            # Warm the page cache for the icon files of the first page before they are rasterized
+            if first:
+                _prefetch_files([a[1] for a in self.filtered_apps[:self.page_size] if a[1] and os.path.isabs(a[1])])
+            self._build_dots_and_placeholders()
+            self.switch_page(0 if first else self.current_page, animate=False)
+        if first:
+            QTimer.singleShot(0, self._start_intro_fx)
+
+    def _resolvable_mask(self):
+        """
+        Per-app flags telling whether each icon in self.apps resolves, for the current use_theme_fallback.
+        """
+        fb = self.use_theme_fallback
+        if self._resolvable is None or self._resolvable[0] != fb:
+            self._resolvable = (fb, [_icon_is_resolvable(a[1], use_theme_fallback=fb) for a in self.apps])
+        return self._resolvable[1]
+
+    def _on_icon_dirs_changed(self):
+        """
+        An icon directory changed: drop the icon index and the resolvability flags built from it.
+        """
+        _invalidate_icon_index()
+        self._resolvable = None
+
+    def _index_search_docs(self):
+        """
+        Precompute the normalized search text of every app for filter_apps.
+        Kept as a plain list: a fixed-width NumPy string array would size every row to the longest
+        multi-locale document (x4 bytes per character).
+        """
+        self._doc_norm = [" ".join((a[3] or "", _normalize_token(a[0] or ""), _normalize_token(a[2] or ""))) for a in self.apps]
+
+    def _page_key(self, page: int):
+        """
+        Identity of a page's contents and layout; a built page is reused while this is unchanged.
+        """
+        start = page * self.page_size
+        return (tuple(self.filtered_apps[start:start + self.page_size]),
+                self.page_size, self.icons_per_row, self.icon_size, self.grid_lr,
+                self.font_family, self.font_pt, self.font_color, self.use_theme_fallback)
+
+    def _stack_index(self, page: int) -> int:
+        """
+        Stack index of a built page, or -1. Only built pages live in the stack, kept in page order.
+        """
+        i = bisect.bisect_left(self._stack_pages, page)
+        return i if i < len(self._stack_pages) and self._stack_pages[i] == page else -1
+
+    def _page_widget(self, page: int):
+        """
+        The widget of a built page, or None.
+        """
+        i = self._stack_index(page)
+        return self.stack.widget(i) if i >= 0 else None
 
     def _build_dots_and_placeholders(self):
         """
-        Build page dots and placeholder widgets for all pages.
+        Sync the page stack and page dots with the filtered list.
+        Pages are added to the stack only when built; built pages whose contents are unchanged
+        are kept, and dots are added/removed only by the delta.
         """
-        for i in reversed(range(self.page_dots_layout.count())):
-            w = self.page_dots_layout.itemAt(i).widget()
-            if w: w.deleteLater()
-        while self.stack.count():
-            w = self.stack.widget(0); self.stack.removeWidget(w); w.deleteLater()
-        self._built_pages.clear()
+        old_built = self._built_pages; old_pages = self._stack_pages
+        if self.stack.count() != len(old_pages):  # e.g. the initial "Loading apps..." holder
+            while self.stack.count():
+                w = self.stack.widget(0); self.stack.removeWidget(w); w.deleteLater()
+            old_pages = []
         self._total = len(self.filtered_apps)
         self._total_pages = max(1, (self._total + self.page_size - 1)//self.page_size)
-        for _ in range(self._total_pages):
-            self.stack.addWidget(QWidget())
-        for page in range(self._total_pages):
-            dot = QLabel("●")
-            dot.setStyleSheet(f"font-size: 16px; color: {'white' if page == 0 else 'gray'}")
-            def mkhandler(p=page):
-                def handler(event): self.switch_page(p)
-                return handler
-            dot.mousePressEvent = mkhandler(page)
-            self.page_dots_layout.addWidget(dot)
+        self._built_pages = {}
+        for i in reversed(range(len(old_pages))):
+            page = old_pages[i]; key = old_built.get(page)
+            if page < self._total_pages and key is not None and key == self._page_key(page):
+                self._built_pages[page] = key
+            else:
+                w = self.stack.widget(i); self.stack.removeWidget(w); w.deleteLater()
+        self._stack_pages = sorted(self._built_pages)
+        dots = self._page_dot_widgets
+        if len(dots) != self._total_pages:
+            for w in dots[self._total_pages:]:
+                self.page_dots_layout.removeWidget(w); w.deleteLater()
+            for page in range(len(dots), self._total_pages):
+                dot = PageDot(page)
+                dot.clicked.connect(self.switch_page)
+                self.page_dots_layout.addWidget(dot)
+            self._rebuild_page_dot_cache()
+        self._set_active_dot(0)
+
+    def _set_active_dot(self, index: int):
+        """
+        Highlight the dot for `index`, restyling only the dots whose state changes.
+        """
+        prev = self._active_dot; dots = self._page_dot_widgets; count = len(dots)
+        if prev != index and 0 <= prev < count:
+            dots[prev].setStyleSheet(DOT_QSS_INACTIVE)
+        if 0 <= index < count:
+            dot = dots[index]
+            if dot.styleSheet() != DOT_QSS_ACTIVE: dot.setStyleSheet(DOT_QSS_ACTIVE)
+        self._active_dot = index
+
+    def _rebuild_page_dot_cache(self):
+        """
+        Snapshot the page dot widgets into a tuple; called whenever dots are added or removed.
+        """
+        layout = self.page_dots_layout
+        self._page_dot_widgets = tuple(w for w in (layout.itemAt(i).widget() for i in range(layout.count())) if w)
 
     def _ensure_page_built(self, page: int):
         """
         Ensure the page at `page` is built.
         """
         if page in self._built_pages: return
-        grid = QGridLayout(); grid.setSpacing(12)
+        # Icons and labels sit in row pairs (icon row r*2, label row r*2+1); no per-cell wrapper widgets
+        grid = QGridLayout(); grid.setVerticalSpacing(2); grid.setHorizontalSpacing(12)
         grid.setContentsMargins(self.grid_lr, 20, self.grid_lr, 20)
         start = page * self.page_size; end = min(start + self.page_size, self._total)
-        self.setUpdatesEnabled(False)
+        # Built detached and inserted as a hidden stack page, so nothing repaints until it is shown
         page_widget = QWidget(); self._make_transparent(page_widget)
+        page_widget.setStyleSheet(PAGE_QSS.format(color=self.font_color))
+        label_width = self.icon_size + 40
+        qfont = QFont(self.font_family) if self.font_family else QFont()
+        qfont.setPointSize(self.font_pt)
+        h_cache = self._label_h_cache; fm = None
         for i in range(start, end):
             name, icon_id, cmd, _blob, workdir, terminal, desktop_file_path = self.filtered_apps[i]
             row, col = divmod(i - start, self.icons_per_row)
-            icon = _icon_from_id(icon_id, self.icon_size, use_theme_fallback=self.use_theme_fallback)
-            app_btn = AppIcon(icon, cmd, self, self.icon_size)
+            app_btn = AppIcon(icon_id, cmd, self, self.icon_size, use_theme_fallback=self.use_theme_fallback)
             app_btn._launch_meta = {'workdir': workdir, 'terminal': terminal, 'name': name, 'icon_id': icon_id, 'desktop_file_path': desktop_file_path}
-            label_width = self.icon_size + 40
-            name_lbl = QLabel()
-            qfont = QFont(self.font_family) if self.font_family else QFont()
-            qfont.setPointSize(self.font_pt)
+            name_lbl = ContentLabel()
             name_lbl.setFont(qfont)
-            name_lbl.setStyleSheet(f"background: transparent; color: {self.font_color}; padding-top: 2px;")
+            name_lbl.setProperty("role", "name")
             name_lbl.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
             name_lbl.setWordWrap(True)
             name_lbl.setFixedWidth(label_width)
-            name_lbl.setContentsMargins(2, 0, 2, 0)
-            name_lbl.setTextFormat(Qt.RichText)
-            rich = _label_html(name)
-            name_lbl.setText(rich)
-            doc = QTextDocument()
-            doc.setDefaultFont(qfont)
-            doc.setHtml(rich)
-            doc.setTextWidth(label_width)
-            name_lbl.setMinimumHeight(int(doc.size().height()) + 4)
+            name_lbl.setContentsMargins(2, 0, 2, 10)
+            # Plain text: Qt.TextWordWrap already breaks at word boundaries or anywhere, centered
+            name_lbl.setTextFormat(Qt.PlainText)
+            name_lbl.setText(name or "")
+            h_key = (name, label_width, self.font_family, self.font_pt)
+            label_h = h_cache.get(h_key)
+            if label_h is None:
+                if fm is None: fm = QFontMetrics(qfont)
+                text_h = fm.boundingRect(0, 0, label_width - 4, 0, Qt.AlignHCenter | Qt.TextWordWrap, name or "").height()
+                label_h = h_cache[h_key] = text_h + 16
+            name_lbl.setMinimumHeight(label_h)
             name_lbl.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Minimum)
-            wrapper = QWidget(); self._make_transparent(wrapper)
-            vl = QVBoxLayout(wrapper); vl.setAlignment(Qt.AlignCenter); vl.setSpacing(2); vl.setContentsMargins(0,0,0,0)
-            vl.addWidget(app_btn, alignment=Qt.AlignCenter); vl.addWidget(name_lbl, alignment=Qt.AlignCenter)
-            grid.addWidget(wrapper, row, col, alignment=Qt.AlignCenter)
+            grid.addWidget(app_btn, row * 2, col, alignment=Qt.AlignHCenter | Qt.AlignBottom)
+            grid.addWidget(name_lbl, row * 2 + 1, col, alignment=Qt.AlignHCenter | Qt.AlignTop)
         page_widget.setLayout(grid)
         self._page_busy = True
-        self.stack.removeWidget(self.stack.widget(page))
-        self.stack.insertWidget(page, page_widget)
-        self.setUpdatesEnabled(True)
-        self._built_pages.add(page)
+        pos = bisect.bisect_left(self._stack_pages, page)
+        self._stack_pages.insert(pos, page)
+        self.stack.insertWidget(pos, page_widget)
+        self._built_pages[page] = self._page_key(page)
         self._page_busy = False
 
     def _set_current_index_safe(self, index: int, animate: bool):
         """
         Safely set the current page index, with or without animation.
         """
+        index = self._stack_index(index)
+        if index < 0: return
         if animate:
             self.stack.setCurrentIndexAnimated(index)
         else:
@@ -1163,19 +1715,37 @@ class AppLauncher(QDialog):
             if not hasattr(self, '_initial_load_done'):
                 self._initial_load_done = True
         self.current_page = index
-        for i in range(self.page_dots_layout.count()):
-            dot = self.page_dots_layout.itemAt(i).widget()
-            if dot: dot.setStyleSheet(f"font-size: 16px; color: {'white' if i == index else 'gray'}")
+        self._set_active_dot(index)
         self.clear_selection()
-        if self.stack.is_animating:
-            def _release_when_done():
-                if not self.stack.is_animating:
-                    self._page_busy = False
-                else:
-                    QTimer.singleShot(20, _release_when_done)
-            _release_when_done()
-        else:
+        if not self.stack.is_animating:
             self._page_busy = False
+            self._schedule_prewarm()
+        # else: _on_page_animation_finished releases the page once the animation ends
+
+    def _on_page_animation_finished(self):
+        """
+        Release the page switch lock after an animated switch and prewarm the neighbors.
+        """
+        self._page_busy = False
+        self._schedule_prewarm()
+
+    def _schedule_prewarm(self):
+        """
+        Queue building the pages next to the current one once the event loop is idle.
+        """
+        if self._prewarm_pending: return
+        self._prewarm_pending = True
+        QTimer.singleShot(0, self._prewarm_neighbors)
+
+    def _prewarm_neighbors(self):
+        """
+        Build the pages on either side of the current page, if they are not built yet.
+        """
+        self._prewarm_pending = False
+        if self._page_busy or self.stack.is_animating: return
+        for page in (self.current_page + 1, self.current_page - 1):
+            if 0 <= page < self._total_pages:
+                self._ensure_page_built(page)
 
     def filter_apps(self, text: str):
         """
@@ -1183,19 +1753,15 @@ class AppLauncher(QDialog):
         """
         q = _normalize_token(text or "").strip()
         if not self.apps: return
+        if self._doc_norm is None: self._index_search_docs()  # searched before the full list arrived
+        apps = self.apps
+        ok = self._resolvable_mask() if self.only_resolvable else None
         if not q:
-            base = self.apps
+            base = apps if ok is None else [a for a, r in zip(apps, ok) if r]
         else:
             tokens = q.split()
-            def matches(a):
-                name_norm = _normalize_token(a[0] or "")
-                cmd_norm  = _normalize_token(a[2] or "")
-                blob      = a[3] or ""
-                doc = " ".join((blob, name_norm, cmd_norm))
-                return all(tok in doc for tok in tokens)
-            base = [a for a in self.apps if matches(a)]
-        if self.only_resolvable:
-            base = [a for a in base if _icon_is_resolvable(a[1], use_theme_fallback=self.use_theme_fallback)]
+            idx = [i for i, d in enumerate(self._doc_norm) if all(t in d for t in tokens)]
+            base = [apps[i] for i in idx] if ok is None else [apps[i] for i in idx if ok[i]]
         self.filtered_apps = base
         self._build_dots_and_placeholders()
         self.switch_page(0, animate=False)
@@ -1206,18 +1772,16 @@ class AppLauncher(QDialog):
         """
         if self.selected_icon_index >= 0:
             page = self.selected_icon_index // self.page_size
-            if page in self._built_pages and 0 <= page < self.stack.count():
+            if page in self._built_pages:
                 icon_index_in_page = self.selected_icon_index % self.page_size
                 row, col = divmod(icon_index_in_page, self.icons_per_row)
-                page_widget = self.stack.widget(page)
+                page_widget = self._page_widget(page)
                 grid = page_widget.layout() if page_widget else None
                 if grid:
-                    item = grid.itemAtPosition(row, col)
-                    wrapper = item.widget() if item else None
-                    if wrapper:
-                        btn = wrapper.findChild(AppIcon)
-                        if btn:
-                            btn.setStyleSheet(APP_ICON_QSS)
+                    item = grid.itemAtPosition(row * 2, col)
+                    btn = item.widget() if item else None
+                    if btn:
+                        btn.setStyleSheet(APP_ICON_QSS)
         self.selected_icon_index = -1
         self.selection_mode = False
 
@@ -1234,13 +1798,11 @@ class AppLauncher(QDialog):
             self.switch_page(page, animate=True)
         icon_index_in_page = index % self.page_size
         row, col = divmod(icon_index_in_page, self.icons_per_row)
-        page_widget = self.stack.widget(page)
+        page_widget = self._page_widget(page)
         grid = page_widget.layout() if page_widget else None
         if not grid: return
-        item = grid.itemAtPosition(row, col)
-        wrapper = item.widget() if item else None
-        if not wrapper: return
-        btn = wrapper.findChild(AppIcon)
+        item = grid.itemAtPosition(row * 2, col)
+        btn = item.widget() if item else None
         if not btn: return
         btn.setStyleSheet(
             APP_ICON_QSS +
@@ -1277,6 +1839,7 @@ class AppLauncher(QDialog):
         """
         Launch a command, optionally in a terminal.
         """
+        import shlex, subprocess
         try:
             argv = shlex.split(cmd, posix=True)
             argv = _substitute_field_codes(argv, name=name, icon=icon_id, desktop_file=desktop_file_path)
@@ -1315,53 +1878,43 @@ class AppLauncher(QDialog):
             QMessageBox.warning(self, "Preferences", f"Could not load preferences:\n{e}")
             return
         dlg = SettingsDialog(self)
-        def _apply_live(s):
-            try:
-                self.stack.set_strategy_by_name(getattr(s, "animation", "slide"))
-                self.stack.set_animation_duration(int(getattr(s, "anim_duration_ms", 280)))
-            except Exception:
-                pass
-            self._install_settings_shortcut(getattr(s, "settings_shortcut", "Ctrl+,"))
-            self._choose_background_from_settings(s)
-            self._bg_source = None
-            self._bg_file_mtime = None
-            self._update_background(force=True)
-            self.page_size = int(getattr(s, "page_size", self.page_size))
-            self.icons_per_row = int(getattr(s, "icons_per_row", self.icons_per_row))
-            self.icon_size = int(getattr(s, "icon_size", self.icon_size))
-            self.grid_lr = int(getattr(s, "grid_margins_lr", self.grid_lr))
-            self.font_family = str(getattr(s, "font_family", self.font_family))
-            self.font_pt = int(getattr(s, "font_point_size", self.font_pt))
-            self.font_color = str(getattr(s, "font_color", self.font_color))
-            self.only_resolvable = bool(getattr(s, "filter_only_apps_with_icon", self.only_resolvable))
-            self.use_theme_fallback = bool(getattr(s, "use_theme_fallback", self.use_theme_fallback))
-            self.wheel_sensitivity = float(getattr(s, "wheel_sensitivity", 1.0))
-            self._bg_dim_alpha = int(getattr(s, "background_dim_alpha", 80))
-            self._build_dots_and_placeholders()
-            self.switch_page(0, animate=False)
-        dlg.on_apply = _apply_live
+        dlg.on_apply = self._apply_settings
         dlg.exec_()
         s = load_settings()
-        self.stack.set_strategy_by_name(getattr(s, "animation", "slide"))
-        self.stack.set_animation_duration(int(getattr(s, "anim_duration_ms", 280)))
-        self._install_settings_shortcut(getattr(s, "settings_shortcut", "Ctrl+,"))
+        if s != self._last_applied_settings:
+            self._apply_settings(s)
+
+    def _apply_settings(self, s):
+        """
+        Apply a Settings instance to the running launcher and rebuild the pages.
+        """
+        try:
+            self.stack.set_strategy_by_name(s.animation)
+            self.stack.set_animation_duration(int(s.anim_duration_ms))
+        except Exception:
+            pass
+        self._install_settings_shortcut(s.settings_shortcut)
         self._choose_background_from_settings(s)
         self._bg_source = None
         self._bg_file_mtime = None
         self._update_background(force=True)
-        self.page_size = int(getattr(s, "page_size", self.page_size))
-        self.icons_per_row = int(getattr(s, "icons_per_row", self.icons_per_row))
-        self.icon_size = int(getattr(s, "icon_size", self.icon_size))
-        self.grid_lr = int(getattr(s, "grid_margins_lr", self.grid_lr))
-        self.font_family = str(getattr(s, "font_family", self.font_family))
-        self.font_pt = int(getattr(s, "font_point_size", self.font_pt))
-        self.font_color = str(getattr(s, "font_color", self.font_color))
-        self.only_resolvable = bool(getattr(s, "filter_only_apps_with_icon", self.only_resolvable))
-        self.use_theme_fallback = bool(getattr(s, "use_theme_fallback", self.use_theme_fallback))
-        self.wheel_sensitivity = float(getattr(s, "wheel_sensitivity", 1.0))
-        self._bg_dim_alpha = int(getattr(s, "background_dim_alpha", 80))
+        self.page_size = int(s.page_size)
+        self.icons_per_row = int(s.icons_per_row)
+        icon_size = int(s.icon_size)
+        if icon_size != self.icon_size:
+            _clear_icon_caches()
+        self.icon_size = icon_size
+        self.grid_lr = int(s.grid_margins_lr)
+        self.font_family = str(s.font_family)
+        self.font_pt = int(s.font_point_size)
+        self.font_color = str(s.font_color)
+        self.only_resolvable = bool(s.filter_only_apps_with_icon)
+        self.use_theme_fallback = bool(s.use_theme_fallback)
+        self.wheel_sensitivity = float(s.wheel_sensitivity)
+        self._bg_dim_alpha = int(s.background_dim_alpha)
         self._build_dots_and_placeholders()
         self.switch_page(0, animate=False)
+        self._last_applied_settings = s
 
     def _is_trackpad_wheel(self, ev) -> bool:
         """
@@ -1398,7 +1951,8 @@ class AppLauncher(QDialog):
         """
         Filter events for wheel and key navigation.
         """
-        if event.type() == QEvent.Wheel and source == self.stack:
+        et = event.type()
+        if et == QEvent.Wheel and source == self.stack:
             if self._page_busy or self.stack.is_animating:
                 return True
             ady = event.angleDelta().y()
@@ -1429,19 +1983,19 @@ class AppLauncher(QDialog):
                     elif direction > 0 and self.current_page > 0:
                         self.switch_page(self.current_page - 1, animate=True)
                 return True
-        if event.type() == QEvent.KeyPress:
+        if et == QEvent.KeyPress:
             key = event.key()
-            if (event.text() and not event.text().isspace() and
-                not event.modifiers() in (Qt.ControlModifier, Qt.AltModifier) and
-                key not in (Qt.Key_Return, Qt.Key_Enter, Qt.Key_Escape, Qt.Key_Tab,
-                           Qt.Key_Backspace, Qt.Key_Delete, Qt.Key_Left, Qt.Key_Right,
-                           Qt.Key_Up, Qt.Key_Down)):
-                self.search_bar.setFocus()
-                self.search_bar.route_lr_to_launcher = False
-                self.search_bar.keyPressEvent(event)
-                return True
-            fw = QApplication.focusWidget(); in_search = (fw is self.search_bar)
-            if not in_search:
+            if key not in _NAV_KEYS:
+                # Printable text without Ctrl/Alt goes to the search bar; text is only fetched here
+                if not (int(event.modifiers()) & _CTRL_ALT_MASK):
+                    text = event.text()
+                    if text and text[:1] > " ":
+                        self.search_bar.setFocus()
+                        self.search_bar.route_lr_to_launcher = False
+                        self.search_bar.keyPressEvent(event)
+                        return True
+                return False
+            if QApplication.focusWidget() is not self.search_bar:
                 if key in (Qt.Key_Left, Qt.Key_Right, Qt.Key_Up, Qt.Key_Down):
                     if self._page_busy or self.stack.is_animating:
                         return True
@@ -1468,56 +2022,49 @@ class AppLauncher(QDialog):
                     else:
                         self.close()
                     return True
-        return super().eventFilter(source, event)
+        return False  # QDialog.eventFilter filters nothing
 
     def mousePressEvent(self, event):
         """
         Close the launcher if the user clicks outside the content.
+        Content widgets (icons, name labels, page dots, the search bar) accept their own presses,
+        so only clicks on empty area propagate up to here. With an icon selected, the click
+        clears the selection instead (like Escape).
         """
-        clicked_widget = self.childAt(event.pos())
-        ignore_widgets = [self.search_bar, self.fx_curtain, self.fx_overlay]
-        for i in range(self.page_dots_layout.count()):
-            w = self.page_dots_layout.itemAt(i).widget()
-            if w:
-                ignore_widgets.append(w)
-        current_page_widget = self.stack.currentWidget()
-        if current_page_widget:
-            for w in current_page_widget.findChildren(QWidget):
-                ignore_widgets.append(w)
-        is_ignored = (
-            clicked_widget is None
-            or clicked_widget in ignore_widgets
-            or any(clicked_widget is w for w in ignore_widgets)
-        )
-        if not is_ignored:
-            self.close()
+        if self.selection_mode:
+            self.clear_selection()
+        elif not (self.fx_curtain.isVisible() or self.fx_overlay.isVisible()):
+            # Click bursts (touchpad jitter) trigger the close only once
+            t = self._close_click_timer
+            if not t.isValid() or t.elapsed() > 150:
+                t.start()
+                QTimer.singleShot(0, self.close)
         super().mousePressEvent(event)
 
     def _run_wallpaper_sync_once(self):
         """
-        Run the wallpaper sync script once.
+        Run the wallpaper sync script once, as a detached process: the launcher quits right
+        after starting an app and must neither wait for nor interrupt the sync.
         """
-        try:
-            py = sys.executable or "python3"
-            QProcess.startDetached(py, ["-m", "vifa_launcher.wallpaper_sync"])
-        except Exception:
-            pass
+        if not QProcess.startDetached(_WALLPAPER_PY, list(_WALLPAPER_ARGS)):
+            import logging  # deferred: only needed on this failure path
+            logging.getLogger(__name__).debug("could not start the wallpaper sync process: %s %s", _WALLPAPER_PY, " ".join(_WALLPAPER_ARGS))
 
 
 def main():
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-    try:
+    if not _IS_QT6:
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    if hasattr(Qt, "HighDpiScaleFactorRoundingPolicy"):  # Qt >= 5.14
         QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
             Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
         )
-    except Exception:
-        pass
+    # Skip Qt's recursive opaque-sibling clipping: the overlays and page tiles make it costly on show/raise
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
     app = QApplication(sys.argv)
     launcher = AppLauncher()
-    launcher.show()
-    launcher.raise_()
-    launcher.activateWindow()
+    launcher.show()  # a newly shown top-level is already on top; no raise_() needed
+    launcher.activateWindow()  # keyboard focus for type-to-search
     sys.exit(app.exec_())
 
 
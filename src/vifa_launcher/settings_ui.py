@@ -22,6 +22,9 @@ os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
 os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "PassThrough")
 
 import sys
+from dataclasses import replace
+from functools import lru_cache
+from types import MappingProxyType
 from PyQt5.QtCore import Qt, QProcess, QTimer
 from PyQt5.QtGui import QColor, QFont, QGuiApplication, QFontMetrics
 from PyQt5.QtWidgets import (
@@ -36,14 +39,14 @@ from PyQt5.QtWidgets import (
 if __package__ is None or __package__ == "":
     THIS_DIR = os.path.dirname(os.path.abspath(__file__)); PARENT = os.path.dirname(THIS_DIR)
     if PARENT not in sys.path: sys.path.insert(0, PARENT)
-    from vifa_launcher.config.io import load_settings, save_settings, CONFIG_FILE, _DEFAULT_DESKTOP_DIRS
+    from vifa_launcher.config.io import load_settings, save_settings, default_desktop_dirs
     from vifa_launcher.transitions.registry import registry
     try:
         from vifa_launcher.ui.scroll import attach_adaptive_scroll
     except Exception:
         attach_adaptive_scroll = None
 else:
-    from .config.io import load_settings, save_settings, CONFIG_FILE, _DEFAULT_DESKTOP_DIRS
+    from .config.io import load_settings, save_settings, default_desktop_dirs
     from .transitions.registry import registry
     try:
         from .ui.scroll import attach_adaptive_scroll
@@ -51,6 +54,141 @@ else:
         attach_adaptive_scroll = None
 
 
+@lru_cache(maxsize=1)
+def _transition_display_names() -> tuple:
+    """Animation combobox entries; the registered transitions do not change while the app runs"""
+    try:
+        names = registry.names()
+    except Exception:
+        names = ["none", "slide", "fade"]
+    return ("No Animation",) + tuple(n.title() for n in names if n != "none")
+
+
+# Theme palettes (read-only) and stylesheet template for SettingsDialog._build_stylesheet
+_PALETTE_DARK = MappingProxyType(dict(
+    bg_primary="#1a1a1a", bg_secondary="#2d2d30", bg_tertiary="#3c3c3c",
+    text_primary="#ffffff", text_secondary="#b3b3b3", text_muted="#808080",
+    accent="#007acc", accent_hover="#106ebe", border="#404040",
+    danger="#f14c4c", success="#4caf50",
+))
+_PALETTE_LIGHT = MappingProxyType(dict(
+    bg_primary="#ffffff", bg_secondary="#f8f9fa", bg_tertiary="#e9ecef",
+    text_primary="#212529", text_secondary="#495057", text_muted="#6c757d",
+    accent="#007acc", accent_hover="#0056b3", border="#dee2e6",
+    danger="#dc3545", success="#28a745",
+))
+# Scaled sizes used as {dp_N} (= round(N * scale)) in the template
+_STYLE_DP_SIZES = (3, 4, 5, 6, 7, 8, 11, 12, 14, 22, 26, 34, 110, 160)
+_STYLE_TEMPLATE = """
+/* Main Dialog */
+QDialog {{
+    background-color: {bg_primary};
+    color: {text_primary};
+    font-size: {fs_body}px;
+}}
+/* Header */
+#headerWidget {{ background-color: {bg_secondary}; border-bottom: 1px solid {border}; }}
+#headerTitle {{ font-size: {fs_header_title}px; font-weight: 600; color: {text_primary}; margin: 0; }}
+#headerSubtitle {{ font-size: {fs_header_sub}px; color: {text_secondary}; margin: 0; }}
+/* Tabs */
+#mainTabs {{ border: none; background-color: {bg_primary}; font-size: {fs_body}px; }}
+#mainTabs::pane {{ border: none; background-color: {bg_primary}; }}
+#mainTabs QTabBar::tab {{
+    background-color: transparent; border: none;
+    padding: {pad_md}px {pad_lg}px; margin: 0 2px; border-radius: {br_medium}px;
+    font-weight: 500; color: {text_secondary}; min-width: {dp_110}px;
+}}
+/* Remove focus outline from tabs */
+#mainTabs QTabBar::tab:focus {{ border: none; }}
+#mainTabs QTabBar::tab:selected:focus {{ border: none; }}
+#mainTabs QTabBar::tab:hover:focus {{ border: none; }}
+QTabBar:focus {{ outline: none; }}
+/* Tab appearance */
+#mainTabs QTabBar::tab:selected {{ background-color: {bg_tertiary}; color: {text_primary}; }}
+#mainTabs QTabBar::tab:hover:!selected {{ background-color: {bg_secondary}; color: {text_primary}; }}
+/* Cards */
+#modernCard {{ background-color: {bg_secondary}; border: 1px solid {border}; border-radius: {br_medium}px; margin: 4px; }}
+#cardTitle {{ font-size: {fs_card_title}px; font-weight: 600; color: {text_primary}; margin: 0 0 {pad_sm}px 0; }}
+/* Labels */
+#settingLabel {{ font-weight: 500; color: {text_primary}; min-width: {dp_160}px; }}
+#formDescription {{ color: {text_muted}; font-size: {fs_small}px; }}
+#infoText {{ color: {text_secondary}; font-size: {fs_body}px; padding: {pad_sm}px 0; }}
+/* Inputs */
+QLineEdit, QComboBox, QSpinBox {{
+    background-color: {bg_primary}; border: 2px solid {border}; border-radius: {br_small}px;
+    padding: {pad_sm}px {pad_md}px; font-size: {fs_body}px; color: {text_primary}; min-height: {min_h_inp}px;
+}}
+QLineEdit:focus, QComboBox:focus, QSpinBox:focus {{ border-color: {accent}; background-color: {bg_primary}; }}
+QComboBox::drop-down {{ border: none; width: {dp_34}px; }}
+QComboBox::down-arrow {{ width: {dp_14}px; height: {dp_14}px; }}
+/* Buttons */
+#primaryButton {{
+    background-color: {accent}; color: white; border: none; border-radius: {br_medium}px;
+    padding: {pad_md}px {dp_26}px; font-weight: 600; font-size: {fs_body}px; min-height: {min_h_btn}px;
+}}
+#primaryButton:hover {{ background-color: {accent_hover}; }}
+#primaryButton:pressed {{ background-color: {accent}; }}
+#secondaryButton {{
+    background-color: {bg_tertiary}; color: {text_primary}; border: 1px solid {border}; border-radius: {br_medium}px;
+    padding: {pad_sm}px {dp_22}px; font-weight: 500; font-size: {fs_body}px; min-height: {min_h_btn}px;
+}}
+#secondaryButton:hover {{ background-color: {bg_secondary}; border-color: {accent}; }}
+#dangerButton {{
+    background-color: {danger}; color: white; border: none; border-radius: {br_medium}px;
+    padding: {pad_sm}px {dp_22}px; font-weight: 500; font-size: {fs_body}px; min-height: {min_h_btn}px;
+}}
+#dangerButton:hover {{ background-color: #c82333; }}
+/* Checks/Radio */
+QCheckBox, QRadioButton {{ color: {text_primary}; font-size: {fs_body}px; spacing: {dp_8}px; }}
+QCheckBox::indicator, QRadioButton::indicator {{ width: {dp_22}px; height: {dp_22}px; }}
+QCheckBox::indicator:unchecked, QRadioButton::indicator:unchecked {{
+    background-color: {bg_primary}; border: 2px solid {border}; border-radius: {dp_5}px;
+}}
+QCheckBox::indicator:checked, QRadioButton::indicator:checked {{
+    background-color: {accent}; border: 2px solid {accent}; border-radius: {dp_5}px;
+}}
+QRadioButton::indicator {{ border-radius: {dp_11}px; }}
+QRadioButton::indicator:checked {{ border-radius: {dp_11}px; }}
+/* Slider */
+QSlider::groove:horizontal {{ height: {slider_groove_h}px; background-color: {bg_tertiary}; border-radius: {dp_3}px; }}
+QSlider::handle:horizontal {{
+    background-color: {accent}; border: none; width: {dp_22}px; height: {dp_22}px;
+    margin: -{dp_8}px 0; border-radius: {dp_11}px;
+}}
+QSlider::handle:horizontal:hover {{ background-color: {accent_hover}; }}
+/* List */
+QListWidget {{
+    background-color: {bg_primary}; border: 1px solid {border}; border-radius: {br_small}px;
+    padding: {dp_4}px; outline: none; font-size: {fs_body}px;
+}}
+QListWidget::item {{
+    background-color: transparent; border: none; padding: {pad_sm}px {pad_md}px;
+    border-radius: {dp_6}px; margin: 2px; color: {text_primary};
+}}
+QListWidget::item:selected {{ background-color: {accent}; color: white; }}
+QListWidget::item:hover:!selected {{ background-color: {bg_secondary}; }}
+/* Scrollbars */
+QScrollArea {{ border: none; background-color: {bg_primary}; }}
+QScrollBar:vertical {{
+    background-color: {bg_secondary}; width: {dp_14}px; border-radius: {dp_7}px; margin: 0;
+}}
+QScrollBar::handle:vertical {{
+    background-color: {text_muted}; border-radius: {dp_7}px; min-height: {dp_34}px; margin: 2px;
+}}
+QScrollBar::handle:vertical:hover {{ background-color: {accent}; }}
+/* Footer */
+#footerWidget {{ background-color: {bg_secondary}; border-top: 1px solid {border}; }}
+/* GroupBox */
+QGroupBox {{
+    font-weight: 600; color: {text_primary}; border: 1px solid {border}; border-radius: {br_small}px;
+    margin: {dp_12}px 0; padding-top: {dp_12}px; font-size: {fs_body}px;
+}}
+QGroupBox::title {{
+    subcontrol-origin: margin; left: {dp_12}px; padding: 0 {dp_8}px; background-color: {bg_primary};
+}}
+"""
+
+
 class ModernCard(QFrame):
     def __init__(self, title="", parent=None):
         super().__init__(parent)
@@ -63,12 +201,19 @@ class ModernCard(QFrame):
 
 
 class SettingsDialog(QDialog):
+    _TAB_TITLES = ("General", "Appearance", "Advanced", "Directories")
+    # Generated theme stylesheets, keyed by (is_dark, rounded ui scale, min readable px)
+    _STYLE_CACHE = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._settings = load_settings()
 
-        # Automatic DPI/scaling calculation
+        # Automatic DPI/scaling calculation (screen metrics are cached until the screens change)
+        self._screen_info = None
+        self._font_metrics_cache = {}
         self._ui_scale = self._calc_ui_scale()
+        self._rebuild_dp_table()
         self._bump_global_font(min_px=self._min_readable_px())
 
         self.setWindowTitle("Preferences")
@@ -77,6 +222,12 @@ class SettingsDialog(QDialog):
         self.setMinimumSize(self._dp(1000), self._dp(700))
         self.resize(self._dp(1200), self._dp(800))
 
+        # Coalesce bursts of screen hotplug events (docks, monitor wake) into one refresh
+        self._screen_change_timer = QTimer(self)
+        self._screen_change_timer.setSingleShot(True)
+        self._screen_change_timer.setInterval(150)
+        self._screen_change_timer.timeout.connect(self._refresh_for_screens)
+
         app = QApplication.instance()
         try:
             app.screenAdded.connect(self._on_screen_changed)
@@ -84,30 +235,13 @@ class SettingsDialog(QDialog):
         except Exception:
             pass
 
+        self.on_apply = None
+        self._scroll_filters = []
         self._setup_ui()
         self._apply_modern_theme()
-        self._load_from_settings()
         self._connect_signals()
-        self.on_apply = None
-
-        # Adaptive scroll behavior
-        if attach_adaptive_scroll:
-            try:
-                self._scroll_general.verticalScrollBar().setSingleStep(12)
-                self._scroll_appearance.verticalScrollBar().setSingleStep(12)
-                self._scroll_advanced.verticalScrollBar().setSingleStep(12)
-                self._scroll_dirs.verticalScrollBar().setSingleStep(12)
-                self.list_dirs.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
-                self.list_dirs.verticalScrollBar().setSingleStep(12)
-            except Exception:
-                pass
-
-            self._scroll_filter = attach_adaptive_scroll(
-                widgets=(self._scroll_general, self._scroll_appearance, self._scroll_advanced, self._scroll_dirs, self.list_dirs),
-                sensitivity_getter=self._get_wheel_sensitivity,
-                paged_for_trackpad=True,
-                gesture_gap_ms=140
-            )
+        # Only the visible tab is built now; the others are built on first visit (_ensure_tab)
+        self._ensure_tab(self.tabs.currentIndex())
 
     # ---------- Automatic scaling and readability ----------
     def _min_readable_px(self) -> int:
@@ -118,8 +252,7 @@ class SettingsDialog(QDialog):
                 return max(12, min(env_px, 28))
         except Exception:
             pass
-        screen = QGuiApplication.primaryScreen()
-        dpi = screen.logicalDotsPerInch() if screen else 96.0
+        dpi, _px = self._screen_metrics()
         if dpi < 110:   return 14
         if dpi < 150:   return 16
         if dpi < 200:   return 18
@@ -133,13 +266,10 @@ class SettingsDialog(QDialog):
                 return max(0.9, min(env_scale, 2.5))
         except Exception:
             pass
-        screen = QGuiApplication.primaryScreen()
-        dpi = screen.logicalDotsPerInch() if screen else 96.0
+        dpi, px = self._screen_metrics()
         base = dpi / 96.0
         extra = 1.0
-        if screen:
-            g = screen.availableGeometry()
-            px = g.width() * g.height()
+        if px is not None:
             if px >= (3840*2160): extra = 1.15
             elif px >= (2560*1440): extra = 1.08
             elif px <= (1366*768): extra = 0.96
@@ -149,14 +279,39 @@ class SettingsDialog(QDialog):
             scale = 1.10
         return float(max(0.9, min(scale, 2.5)))
 
-    def _dp(self, px: int) -> int:
+    def _screen_metrics(self):
+        """Return (logical DPI, available pixel count or None) of the primary screen, cached"""
+        if self._screen_info is None:
+            screen = QGuiApplication.primaryScreen()
+            if screen:
+                g = screen.availableGeometry()
+                self._screen_info = (screen.logicalDotsPerInch(), g.width() * g.height())
+            else:
+                self._screen_info = (96.0, None)
+        return self._screen_info
+
+    # Pixel sizes used while building the UI; _dp() serves them from a table rebuilt per scale
+    _DP_SIZES = (4, 8, 12, 16, 20, 24, 32, 80, 100, 120, 150, 200, 300, 700, 800, 1000, 1200)
+
+    def _rebuild_dp_table(self):
+        """Precompute the scaled values of the common pixel sizes and bind _dp() for the current UI scale"""
+        s = self._ui_scale
+        self._dp_tbl = {px: int(round(px * s)) for px in self._DP_SIZES}
+        # At 1.0 scale (96 DPI) _dp() is the identity, so skip the lookup entirely
+        self._dp = (lambda px: px) if abs(s - 1.0) < 1e-6 else self._dp_scaled
+
+    def _dp_scaled(self, px: int) -> int:
         """Convert pixels to density-independent pixels"""
-        return int(round(px * self._ui_scale))
+        v = self._dp_tbl.get(px)
+        return v if v is not None else int(round(px * self._ui_scale))
 
     def _bump_global_font(self, min_px: int = 16):
         """Ensure font size meets minimum readability requirements"""
         f = QApplication.font()
-        fm = QFontMetrics(f)
+        key = f.key()
+        fm = self._font_metrics_cache.get(key)
+        if fm is None:
+            fm = self._font_metrics_cache[key] = QFontMetrics(f)
         if fm.height() >= min_px:
             return
         base_pt = f.pointSizeF() if f.pointSizeF() > 0 else float(f.pointSize() or 11)
@@ -169,12 +324,18 @@ class SettingsDialog(QDialog):
         old = self._ui_scale
         self._ui_scale = self._calc_ui_scale()
         if abs(self._ui_scale - old) > 0.01:
+            self._rebuild_dp_table()
             self._bump_global_font(min_px=self._min_readable_px())
             self._apply_modern_theme()
             self.setMinimumSize(self._dp(1000), self._dp(700))
 
     def _on_screen_changed(self, *args):
-        """Handle screen configuration changes"""
+        """Handle screen configuration changes (debounced)"""
+        self._screen_change_timer.start()
+
+    def _refresh_for_screens(self):
+        """Drop cached screen metrics and refresh the scale after screens changed"""
+        self._screen_info = None
         self._recompute_scale_and_refresh()
 
     def _get_wheel_sensitivity(self) -> float:
@@ -203,10 +364,16 @@ class SettingsDialog(QDialog):
             pass
         main.addWidget(self.tabs, 1)
 
-        self._create_general_tab()
-        self._create_appearance_tab()
-        self._create_advanced_tab()
-        self._create_directories_tab()
+        # (builder, settings loader, signal hookup) per tab; tabs start as empty placeholders
+        self._tab_parts = (
+            (self._create_general_tab, self._load_general_tab, None),
+            (self._create_appearance_tab, self._load_appearance_tab, self._connect_appearance_tab),
+            (self._create_advanced_tab, self._load_advanced_tab, None),
+            (self._create_directories_tab, self._fill_dirs_list, self._connect_directories_tab),
+        )
+        self._tab_built = [False] * len(self._TAB_TITLES)
+        for title in self._TAB_TITLES:
+            self.tabs.addTab(QWidget(), title)
 
         footer = QWidget(); footer.setObjectName("footerWidget"); footer.setFixedHeight(self._dp(80))
         fl = QHBoxLayout(footer); fl.setContentsMargins(self._dp(32), self._dp(20), self._dp(32), self._dp(20)); fl.setSpacing(self._dp(12))
@@ -217,25 +384,60 @@ class SettingsDialog(QDialog):
         self.btn_save = QPushButton("Save Settings"); self.btn_save.setObjectName("primaryButton"); self.btn_save.setDefault(True); fl.addWidget(self.btn_save)
         main.addWidget(footer)
 
+    def _ensure_tab(self, index: int):
+        """Build a tab on its first visit: replace the placeholder, load its settings and connect it"""
+        if not (0 <= index < len(self._tab_built)) or self._tab_built[index]: return
+        self._tab_built[index] = True
+        build, load, connect = self._tab_parts[index]
+        page = build()
+        current = self.tabs.currentIndex()
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index); self.tabs.insertTab(index, page, self._TAB_TITLES[index])
+        self.tabs.setCurrentIndex(current)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        load()
+        if connect: connect()
+        if attach_adaptive_scroll:
+            widgets = (page, self.list_dirs) if page is getattr(self, "_scroll_dirs", None) else (page,)
+            try:
+                for wdg in widgets: wdg.verticalScrollBar().setSingleStep(12)
+            except Exception:
+                pass
+            self._scroll_filters.append(attach_adaptive_scroll(
+                widgets=widgets,
+                sensitivity_getter=self._get_wheel_sensitivity,
+                paged_for_trackpad=True,
+                gesture_gap_ms=140
+            ))
+
+    def _ensure_all_tabs(self):
+        """Build every tab that has not been visited yet"""
+        for i in range(len(self._tab_built)):
+            self._ensure_tab(i)
+
     def _label(self, text: str) -> QLabel:
         """Create a standardized setting label"""
         lb = QLabel(text); lb.setObjectName("settingLabel"); return lb
 
+    def _make_scrolled_tab(self):
+        """Create a frameless scroll area for a tab page; returns (scroll area, page layout)"""
+        sa = QScrollArea(); sa.setWidgetResizable(True); sa.setFrameStyle(QFrame.NoFrame)
+        w = QWidget(); l = QVBoxLayout(w)
+        m = self._dp(24); l.setContentsMargins(m, m, m, m); l.setSpacing(m)
+        sa.setWidget(w)
+        return sa, l
+
     def _create_general_tab(self):
         """Create the General settings tab"""
-        self._scroll_general = QScrollArea(); self._scroll_general.setWidgetResizable(True); self._scroll_general.setFrameStyle(QFrame.NoFrame)
-        w = QWidget(); l = QVBoxLayout(w); l.setContentsMargins(self._dp(24), self._dp(24), self._dp(24), self._dp(24)); l.setSpacing(self._dp(24))
+        self._scroll_general, l = self._make_scrolled_tab()
 
         card = ModernCard("Animation & Behavior")
         r1 = QHBoxLayout(); r1.setSpacing(self._dp(16))
         r1.addWidget(self._label("Transition Animation:"))
         self.cb_animation = QComboBox(); self.cb_animation.setMinimumWidth(self._dp(200))
-        try:
-            names = registry.names()
-        except Exception:
-            names = ["none", "slide", "fade"]
-        display = ["No Animation"] + [n.title() for n in names if n != "none"]
-        self.cb_animation.addItems(display); r1.addWidget(self.cb_animation); r1.addStretch()
+        self.cb_animation.addItems(_transition_display_names()); r1.addWidget(self.cb_animation); r1.addStretch()
         card.content_layout.addLayout(r1)
 
         r2 = QHBoxLayout(); r2.setSpacing(self._dp(16))
@@ -252,13 +454,11 @@ class SettingsDialog(QDialog):
         card.content_layout.addLayout(r3)
 
         l.addWidget(card); l.addStretch()
-        self._scroll_general.setWidget(w)
-        self.tabs.addTab(self._scroll_general, "General")
+        return self._scroll_general
 
     def _create_appearance_tab(self):
         """Create the Appearance settings tab"""
-        self._scroll_appearance = QScrollArea(); self._scroll_appearance.setWidgetResizable(True); self._scroll_appearance.setFrameStyle(QFrame.NoFrame)
-        w = QWidget(); l = QVBoxLayout(w); l.setContentsMargins(self._dp(24), self._dp(24), self._dp(24), self._dp(24)); l.setSpacing(self._dp(24))
+        self._scroll_appearance, l = self._make_scrolled_tab()
 
         bg = ModernCard("Background Settings")
         mode = QWidget(); ml = QVBoxLayout(mode); ml.setContentsMargins(0,0,0,0); ml.setSpacing(self._dp(12))
@@ -319,13 +519,11 @@ class SettingsDialog(QDialog):
 
         l.addWidget(font_card)
         l.addStretch()
-        self._scroll_appearance.setWidget(w)
-        self.tabs.addTab(self._scroll_appearance, "Appearance")
+        return self._scroll_appearance
 
     def _create_advanced_tab(self):
         """Create the Advanced settings tab"""
-        self._scroll_advanced = QScrollArea(); self._scroll_advanced.setWidgetResizable(True); self._scroll_advanced.setFrameStyle(QFrame.NoFrame)
-        w = QWidget(); l = QVBoxLayout(w); l.setContentsMargins(self._dp(24), self._dp(24), self._dp(24), self._dp(24)); l.setSpacing(self._dp(24))
+        self._scroll_advanced, l = self._make_scrolled_tab()
 
         layout_card = ModernCard("Layout")
         grid = QGridLayout(); grid.setSpacing(self._dp(16)); grid.setColumnStretch(1,1); grid.setColumnStretch(3,1)
@@ -348,13 +546,11 @@ class SettingsDialog(QDialog):
         filter_card.content_layout.addWidget(self.cb_theme_fallback)
         l.addWidget(filter_card)
         l.addStretch()
-        self._scroll_advanced.setWidget(w)
-        self.tabs.addTab(self._scroll_advanced, "Advanced")
+        return self._scroll_advanced
 
     def _create_directories_tab(self):
         """Create the Directories settings tab"""
-        self._scroll_dirs = QScrollArea(); self._scroll_dirs.setWidgetResizable(True); self._scroll_dirs.setFrameStyle(QFrame.NoFrame)
-        w = QWidget(); l = QVBoxLayout(w); l.setContentsMargins(self._dp(24), self._dp(24), self._dp(24), self._dp(24)); l.setSpacing(self._dp(24))
+        self._scroll_dirs, l = self._make_scrolled_tab()
 
         dirs_card = ModernCard("Directories")
         info = QLabel("Manage the directories where .desktop files are searched for.")
@@ -371,8 +567,7 @@ class SettingsDialog(QDialog):
         self.btn_remove_ddir = QPushButton("Remove"); self.btn_remove_ddir.setObjectName("dangerButton"); btn_row.addWidget(self.btn_remove_ddir)
         btn_row.addStretch(); dirs_card.content_layout.addLayout(btn_row)
         l.addWidget(dirs_card); l.addStretch()
-        self._scroll_dirs.setWidget(w)
-        self.tabs.addTab(self._scroll_dirs, "Directories")
+        return self._scroll_dirs
 
     # ---------- Theme Application ----------
     def _apply_modern_theme(self):
@@ -381,142 +576,34 @@ class SettingsDialog(QDialog):
         palette = app.palette()
         window_color = palette.color(palette.Window)
         is_dark = (0.299 * window_color.red() + 0.587 * window_color.green() + 0.114 * window_color.blue()) < 128
-
-        if is_dark:
-            bg_primary = "#1a1a1a"; bg_secondary = "#2d2d30"; bg_tertiary = "#3c3c3c"
-            text_primary = "#ffffff"; text_secondary = "#b3b3b3"; text_muted = "#808080"
-            accent = "#007acc"; accent_hover = "#106ebe"; border = "#404040"
-            danger = "#f14c4c"; success = "#4caf50"
-        else:
-            bg_primary = "#ffffff"; bg_secondary = "#f8f9fa"; bg_tertiary = "#e9ecef"
-            text_primary = "#212529"; text_secondary = "#495057"; text_muted = "#6c757d"
-            accent = "#007acc"; accent_hover = "#0056b3"; border = "#dee2e6"
-            danger = "#dc3545"; success = "#28a745"
-
-        s  = float(self._ui_scale)
         min_px = self._min_readable_px()
-        fs_header_title   = max(min_px+6, int(round(24 * s)))
-        fs_header_sub     = max(min_px-2, int(round(14 * s)))
-        fs_card_title     = max(min_px-1, int(round(16 * s)))
-        fs_body           = max(min_px,   int(round(15 * s)))
-        fs_small          = max(min_px-2, int(round(13 * s)))
-        pad_sm = max(6,  int(round(8 * s)))
-        pad_md = max(8,  int(round(10 * s)))
-        pad_lg = max(12, int(round(12 * s)))
-        min_h_btn = max(min_px+8, int(round(36 * s)))
-        min_h_inp = max(min_px+6, int(round(34 * s)))
-        br_small  = max(6,  int(round(8 * s)))
-        br_medium = max(8,  int(round(12 * s)))
-
-        stylesheet = f"""
-        /* Main Dialog */
-        QDialog {{
-            background-color: {bg_primary};
-            color: {text_primary};
-            font-size: {fs_body}px;
-        }}
-        /* Header */
-        #headerWidget {{ background-color: {bg_secondary}; border-bottom: 1px solid {border}; }}
-        #headerTitle {{ font-size: {fs_header_title}px; font-weight: 600; color: {text_primary}; margin: 0; }}
-        #headerSubtitle {{ font-size: {fs_header_sub}px; color: {text_secondary}; margin: 0; }}
-        /* Tabs */
-        #mainTabs {{ border: none; background-color: {bg_primary}; font-size: {fs_body}px; }}
-        #mainTabs::pane {{ border: none; background-color: {bg_primary}; }}
-        #mainTabs QTabBar::tab {{
-            background-color: transparent; border: none;
-            padding: {pad_md}px {pad_lg}px; margin: 0 2px; border-radius: {br_medium}px;
-            font-weight: 500; color: {text_secondary}; min-width: {int(round(110*s))}px;
-        }}
-        /* Remove focus outline from tabs */
-        #mainTabs QTabBar::tab:focus {{ border: none; }}
-        #mainTabs QTabBar::tab:selected:focus {{ border: none; }}
-        #mainTabs QTabBar::tab:hover:focus {{ border: none; }}
-        QTabBar:focus {{ outline: none; }}
-        /* Tab appearance */
-        #mainTabs QTabBar::tab:selected {{ background-color: {bg_tertiary}; color: {text_primary}; }}
-        #mainTabs QTabBar::tab:hover:!selected {{ background-color: {bg_secondary}; color: {text_primary}; }}
-        /* Cards */
-        #modernCard {{ background-color: {bg_secondary}; border: 1px solid {border}; border-radius: {br_medium}px; margin: 4px; }}
-        #cardTitle {{ font-size: {fs_card_title}px; font-weight: 600; color: {text_primary}; margin: 0 0 {max(6,int(round(8*s)))}px 0; }}
-        /* Labels */
-        #settingLabel {{ font-weight: 500; color: {text_primary}; min-width: {int(round(160*s))}px; }}
-        #formDescription {{ color: {text_muted}; font-size: {fs_small}px; }}
-        #infoText {{ color: {text_secondary}; font-size: {fs_body}px; padding: {pad_sm}px 0; }}
-        /* Inputs */
-        QLineEdit, QComboBox, QSpinBox {{
-            background-color: {bg_primary}; border: 2px solid {border}; border-radius: {br_small}px;
-            padding: {pad_sm}px {pad_md}px; font-size: {fs_body}px; color: {text_primary}; min-height: {min_h_inp}px;
-        }}
-        QLineEdit:focus, QComboBox:focus, QSpinBox:focus {{ border-color: {accent}; background-color: {bg_primary}; }}
-        QComboBox::drop-down {{ border: none; width: {int(round(34*s))}px; }}
-        QComboBox::down-arrow {{ width: {int(round(14*s))}px; height: {int(round(14*s))}px; }}
-        /* Buttons */
-        #primaryButton {{
-            background-color: {accent}; color: white; border: none; border-radius: {br_medium}px;
-            padding: {pad_md}px {int(round(26*s))}px; font-weight: 600; font-size: {fs_body}px; min-height: {min_h_btn}px;
-        }}
-        #primaryButton:hover {{ background-color: {accent_hover}; }}
-        #primaryButton:pressed {{ background-color: {accent}; }}
-        #secondaryButton {{
-            background-color: {bg_tertiary}; color: {text_primary}; border: 1px solid {border}; border-radius: {br_medium}px;
-            padding: {pad_sm}px {int(round(22*s))}px; font-weight: 500; font-size: {fs_body}px; min-height: {min_h_btn}px;
-        }}
-        #secondaryButton:hover {{ background-color: {bg_secondary}; border-color: {accent}; }}
-        #dangerButton {{
-            background-color: {danger}; color: white; border: none; border-radius: {br_medium}px;
-            padding: {pad_sm}px {int(round(22*s))}px; font-weight: 500; font-size: {fs_body}px; min-height: {min_h_btn}px;
-        }}
-        #dangerButton:hover {{ background-color: #c82333; }}
-        /* Checks/Radio */
-        QCheckBox, QRadioButton {{ color: {text_primary}; font-size: {fs_body}px; spacing: {int(round(8*s))}px; }}
-        QCheckBox::indicator, QRadioButton::indicator {{ width: {int(round(22*s))}px; height: {int(round(22*s))}px; }}
-        QCheckBox::indicator:unchecked, QRadioButton::indicator:unchecked {{
-            background-color: {bg_primary}; border: 2px solid {border}; border-radius: {int(round(5*s))}px;
-        }}
-        QCheckBox::indicator:checked, QRadioButton::indicator:checked {{
-            background-color: {accent}; border: 2px solid {accent}; border-radius: {int(round(5*s))}px;
-        }}
-        QRadioButton::indicator {{ border-radius: {int(round(11*s))}px; }}
-        QRadioButton::indicator:checked {{ border-radius: {int(round(11*s))}px; }}
-        /* Slider */
-        QSlider::groove:horizontal {{ height: {max(4,int(round(7*s)))}px; background-color: {bg_tertiary}; border-radius: {int(round(3*s))}px; }}
-        QSlider::handle:horizontal {{
-            background-color: {accent}; border: none; width: {int(round(22*s))}px; height: {int(round(22*s))}px;
-            margin: -{int(round(8*s))}px 0; border-radius: {int(round(11*s))}px;
-        }}
-        QSlider::handle:horizontal:hover {{ background-color: {accent_hover}; }}
-        /* List */
-        QListWidget {{
-            background-color: {bg_primary}; border: 1px solid {border}; border-radius: {br_small}px;
-            padding: {int(round(4*s))}px; outline: none; font-size: {fs_body}px;
-        }}
-        QListWidget::item {{
-            background-color: transparent; border: none; padding: {pad_sm}px {pad_md}px;
-            border-radius: {int(round(6*s))}px; margin: 2px; color: {text_primary};
-        }}
-        QListWidget::item:selected {{ background-color: {accent}; color: white; }}
-        QListWidget::item:hover:!selected {{ background-color: {bg_secondary}; }}
-        /* Scrollbars */
-        QScrollArea {{ border: none; background-color: {bg_primary}; }}
-        QScrollBar:vertical {{
-            background-color: {bg_secondary}; width: {int(round(14*s))}px; border-radius: {int(round(7*s))}px; margin: 0;
-        }}
-        QScrollBar::handle:vertical {{
-            background-color: {text_muted}; border-radius: {int(round(7*s))}px; min-height: {int(round(34*s))}px; margin: 2px;
-        }}
-        QScrollBar::handle:vertical:hover {{ background-color: {accent}; }}
-        /* Footer */
-        #footerWidget {{ background-color: {bg_secondary}; border-top: 1px solid {border}; }}
-        /* GroupBox */
-        QGroupBox {{
-            font-weight: 600; color: {text_primary}; border: 1px solid {border}; border-radius: {br_small}px;
-            margin: {int(round(12*s))}px 0; padding-top: {int(round(12*s))}px; font-size: {fs_body}px;
-        }}
-        QGroupBox::title {{
-            subcontrol-origin: margin; left: {int(round(12*s))}px; padding: 0 {int(round(8*s))}px; background-color: {bg_primary};
-        }}
-        """
-        self.setStyleSheet(stylesheet)
+        key = (is_dark, round(float(self._ui_scale), 2), min_px)
+        stylesheet = self._STYLE_CACHE.get(key)
+        if stylesheet is None:
+            stylesheet = self._STYLE_CACHE[key] = self._build_stylesheet(*key)
+        if self.styleSheet() != stylesheet:
+            self.setStyleSheet(stylesheet)
+
+    def _build_stylesheet(self, is_dark: bool, s: float, min_px: int) -> str:
+        """Generate the theme stylesheet for a color scheme, UI scale and minimum font size"""
+        vals = dict(_PALETTE_DARK if is_dark else _PALETTE_LIGHT)
+        vals.update(
+            fs_header_title=max(min_px+6, int(round(24 * s))),
+            fs_header_sub=max(min_px-2, int(round(14 * s))),
+            fs_card_title=max(min_px-1, int(round(16 * s))),
+            fs_body=max(min_px,   int(round(15 * s))),
+            fs_small=max(min_px-2, int(round(13 * s))),
+            pad_sm=max(6,  int(round(8 * s))),
+            pad_md=max(8,  int(round(10 * s))),
+            pad_lg=max(12, int(round(12 * s))),
+            min_h_btn=max(min_px+8, int(round(36 * s))),
+            min_h_inp=max(min_px+6, int(round(34 * s))),
+            br_small=max(6,  int(round(8 * s))),
+            br_medium=max(8,  int(round(12 * s))),
+            slider_groove_h=max(4, int(round(7 * s))),
+        )
+        for n in _STYLE_DP_SIZES: vals[f"dp_{n}"] = int(round(n * s))
+        return _STYLE_TEMPLATE.format_map(vals)
 
     # ---------- Signal Connections ----------
     def _connect_signals(self):
@@ -525,7 +612,10 @@ class SettingsDialog(QDialog):
         self.btn_apply.clicked.connect(self._on_apply_clicked)
         self.btn_save.clicked.connect(self._on_save_clicked)
         self.btn_defaults.clicked.connect(self._on_defaults_clicked)
+        self.tabs.currentChanged.connect(self._ensure_tab)
 
+    def _connect_appearance_tab(self):
+        """Connect the Appearance tab's signals"""
         self.rb_wp.toggled.connect(self._update_enabled_states)
         self.rb_image.toggled.connect(self._update_enabled_states)
         self.rb_color.toggled.connect(self._update_enabled_states)
@@ -536,6 +626,8 @@ class SettingsDialog(QDialog):
         self.sl_darkness.valueChanged.connect(self.sb_darkness.setValue)
         self.sb_darkness.valueChanged.connect(self.sl_darkness.setValue)
 
+    def _connect_directories_tab(self):
+        """Connect the Directories tab's signals"""
         self.btn_add_ddir.clicked.connect(self._on_add_ddir_clicked)
         self.btn_remove_ddir.clicked.connect(self._on_remove_ddir_clicked)
         self.list_dirs.itemChanged.connect(self._on_dir_item_changed)
@@ -577,7 +669,12 @@ class SettingsDialog(QDialog):
 
     # ---------- Data Loading/Saving ----------
     def _load_from_settings(self):
-        """Load current settings into the UI form"""
+        """Load current settings into the UI form (built tabs only)"""
+        for (_build, load, _connect), built in zip(self._tab_parts, self._tab_built):
+            if built: load()
+
+    def _load_general_tab(self):
+        """Load settings into the General tab"""
         s = self._settings
         anim = getattr(s, "animation", "slide")
         display = "No Animation" if anim == "none" else anim.title()
@@ -590,6 +687,9 @@ class SettingsDialog(QDialog):
         if shortcut in items: self.cb_shortcut.setCurrentText(shortcut)
         else: self.cb_shortcut.insertItem(0, shortcut); self.cb_shortcut.setCurrentIndex(0)
 
+    def _load_appearance_tab(self):
+        """Load settings into the Appearance tab"""
+        s = self._settings
         mode = getattr(s, "background_mode", "wp_sync")
         if mode == "custom_image": self.rb_image.setChecked(True)
         elif mode == "color": self.rb_color.setChecked(True)
@@ -604,7 +704,11 @@ class SettingsDialog(QDialog):
         self.le_font_family.setText(getattr(s, "font_family", ""))
         self.sb_font_pt.setValue(int(getattr(s, "font_point_size", 12)))
         self.le_font_color.setText(getattr(s, "font_color", "#FFFFFF"))
+        self._update_enabled_states()
 
+    def _load_advanced_tab(self):
+        """Load settings into the Advanced tab"""
+        s = self._settings
         self.sb_page_size.setValue(int(getattr(s, "page_size", 35)))
         self.sb_icons_per_row.setValue(int(getattr(s, "icons_per_row", 7)))
         self.sb_icon_size.setValue(int(getattr(s, "icon_size", 115)))
@@ -613,17 +717,14 @@ class SettingsDialog(QDialog):
         self.cb_only_res.setChecked(bool(getattr(s, "filter_only_apps_with_icon", False)))
         self.cb_theme_fallback.setChecked(bool(getattr(s, "use_theme_fallback", True)))
 
-        self._fill_dirs_list()
-        self._update_enabled_states()
-
     def _fill_dirs_list(self):
         """Populate the directories list with current settings"""
-        self.list_dirs.blockSignals(True)
+        self.list_dirs.setUpdatesEnabled(False); self.list_dirs.blockSignals(True)
         self.list_dirs.clear()
         s = self._settings
         disabled = set(getattr(s, "desktop_dirs_disabled", []) or [])
         custom = list(getattr(s, "desktop_dirs_custom", []) or [])
-        for path in _DEFAULT_DESKTOP_DIRS:
+        for path in default_desktop_dirs():
             item = QListWidgetItem(f"📁 {path} (System)")
             item.setFlags(item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable)
             item.setCheckState(Qt.Unchecked if path in disabled else Qt.Checked)
@@ -635,7 +736,7 @@ class SettingsDialog(QDialog):
             item.setCheckState(Qt.Checked if path not in disabled else Qt.Unchecked)
             item.setData(Qt.UserRole, {"is_system": False, "path": path})
             self.list_dirs.addItem(item)
-        self.list_dirs.blockSignals(False)
+        self.list_dirs.blockSignals(False); self.list_dirs.setUpdatesEnabled(True)
         self._update_remove_button_enabled()
 
     def _update_remove_button_enabled(self):
@@ -659,18 +760,16 @@ class SettingsDialog(QDialog):
         """Add a new directory to search for .desktop files"""
         path = QFileDialog.getExistingDirectory(self, "Select Directory with .desktop Files")
         if not path: return
-        if path in _DEFAULT_DESKTOP_DIRS:
+        if path in default_desktop_dirs():
             for i in range(self.list_dirs.count()):
                 item = self.list_dirs.item(i); info = item.data(Qt.UserRole) or {}
                 if info.get("path") == path: item.setCheckState(Qt.Checked); break
         else:
-            if not hasattr(self._settings, 'desktop_dirs_custom'):
-                self._settings.desktop_dirs_custom = []
-            if path not in self._settings.desktop_dirs_custom:
-                self._settings.desktop_dirs_custom.append(path)
-            if hasattr(self._settings, 'desktop_dirs_disabled'):
-                try: self._settings.desktop_dirs_disabled.remove(path)
-                except ValueError: pass
+            s = self._settings
+            custom = list(s.desktop_dirs_custom)
+            if path not in custom: custom.append(path)
+            disabled = [p for p in s.desktop_dirs_disabled if p != path]
+            self._settings = replace(s, desktop_dirs_custom=custom, desktop_dirs_disabled=disabled)
         self._fill_dirs_list()
 
     def _on_remove_ddir_clicked(self):
@@ -680,25 +779,22 @@ class SettingsDialog(QDialog):
         info = item.data(Qt.UserRole) or {}
         if info.get("is_system", True): return
         path = info.get("path")
-        if hasattr(self._settings, 'desktop_dirs_custom') and path in self._settings.desktop_dirs_custom:
-            self._settings.desktop_dirs_custom.remove(path)
-        if hasattr(self._settings, 'desktop_dirs_disabled'):
-            try: self._settings.desktop_dirs_disabled.remove(path)
-            except ValueError: pass
+        s = self._settings
+        self._settings = replace(
+            s,
+            desktop_dirs_custom=[p for p in s.desktop_dirs_custom if p != path],
+            desktop_dirs_disabled=[p for p in s.desktop_dirs_disabled if p != path],
+        )
         self._fill_dirs_list()
 
     def _on_dir_item_changed(self, item):
         """Handle directory item checkbox state changes"""
         info = item.data(Qt.UserRole) or {}
         path = info.get("path")
-        if not hasattr(self._settings, 'desktop_dirs_disabled'):
-            self._settings.desktop_dirs_disabled = []
-        if item.checkState() == Qt.Checked:
-            try: self._settings.desktop_dirs_disabled.remove(path)
-            except ValueError: pass
-        else:
-            if path not in self._settings.desktop_dirs_disabled:
-                self._settings.desktop_dirs_disabled.append(path)
+        disabled = [p for p in self._settings.desktop_dirs_disabled if p != path]
+        if item.checkState() != Qt.Checked:
+            disabled.append(path)
+        self._settings = replace(self._settings, desktop_dirs_disabled=disabled)
 
     def _on_defaults_clicked(self):
         """Reset all settings to default values"""
@@ -708,6 +804,7 @@ class SettingsDialog(QDialog):
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if reply != QMessageBox.Yes: return
+        self._ensure_all_tabs()
 
         self.cb_animation.setCurrentText("Slide")
         self.sb_duration.setValue(280)
@@ -725,50 +822,64 @@ class SettingsDialog(QDialog):
 
         self.cb_only_res.setChecked(False); self.cb_theme_fallback.setChecked(True)
 
-        if hasattr(self._settings, 'desktop_dirs_custom'): self._settings.desktop_dirs_custom = []
-        if hasattr(self._settings, 'desktop_dirs_disabled'): self._settings.desktop_dirs_disabled = []
+        self._settings = replace(self._settings, desktop_dirs_custom=[], desktop_dirs_disabled=[])
         self._fill_dirs_list(); self._update_enabled_states()
 
         self._recompute_scale_and_refresh()
 
     def _read_form(self):
-        """Read values from UI form into settings object"""
-        s = self._settings
-        anim_text = self.cb_animation.currentText()
-        s.animation = "none" if anim_text == "No Animation" else anim_text.lower()
-        s.anim_duration_ms = int(self.sb_duration.value())
-        s.settings_shortcut = self.cb_shortcut.currentText().strip() or "Ctrl+,"
-
-        if self.rb_image.isChecked(): s.background_mode = "custom_image"
-        elif self.rb_color.isChecked(): s.background_mode = "color"
-        else: s.background_mode = "wp_sync"
-        s.background_custom_path = self.le_image.text().strip()
-        s.background_color = self.le_color.text().strip() or "#510545"
-        s.blur_percent = int(self.sb_blur.value())
-
-        s.background_dim_alpha = int(self.sb_darkness.value() * 2.55)
-
-        s.font_family = self.le_font_family.text().strip()
-        s.font_point_size = int(self.sb_font_pt.value())
-        s.font_color = self.le_font_color.text().strip() or "#FFFFFF"
-
-        s.page_size = int(self.sb_page_size.value())
-        s.icons_per_row = int(self.sb_icons_per_row.value())
-        s.icon_size = int(self.sb_icon_size.value())
-        s.grid_margins_lr = int(self.sb_grid_lr.value())
-
-        s.filter_only_apps_with_icon = bool(self.cb_only_res.isChecked())
-        s.use_theme_fallback = bool(self.cb_theme_fallback.isChecked())
-
-        disabled = []; custom = []
-        for i in range(self.list_dirs.count()):
-            item = self.list_dirs.item(i)
-            info = item.data(Qt.UserRole) or {}
-            path = info.get("path")
-            if not info.get("is_system", True): custom.append(path)
-            if item.checkState() != Qt.Checked: disabled.append(path)
-        s.desktop_dirs_custom = custom
-        s.desktop_dirs_disabled = disabled
+        """Read values from UI form into a new settings object (unvisited tabs keep their settings)"""
+        general, appearance, advanced, directories = self._tab_built
+        kw = {}
+        if general:
+            anim_text = self.cb_animation.currentText()
+            kw.update(
+                animation="none" if anim_text == "No Animation" else anim_text.lower(),
+                anim_duration_ms=int(self.sb_duration.value()),
+                settings_shortcut=self.cb_shortcut.currentText().strip() or "Ctrl+,",
+            )
+        if appearance:
+            if self.rb_image.isChecked(): background_mode = "custom_image"
+            elif self.rb_color.isChecked(): background_mode = "color"
+            else: background_mode = "wp_sync"
+            kw.update(
+                background_mode=background_mode,
+                background_custom_path=self.le_image.text().strip(),
+                background_color=self.le_color.text().strip() or "#510545",
+                blur_percent=int(self.sb_blur.value()),
+                background_dim_alpha=int(self.sb_darkness.value() * 2.55),
+
+                font_family=self.le_font_family.text().strip(),
+                font_point_size=int(self.sb_font_pt.value()),
+                font_color=self.le_font_color.text().strip() or "#FFFFFF",
+            )
+        if advanced:
+            kw.update(
+                page_size=int(self.sb_page_size.value()),
+                icons_per_row=int(self.sb_icons_per_row.value()),
+                icon_size=int(self.sb_icon_size.value()),
+                grid_margins_lr=int(self.sb_grid_lr.value()),
+
+                filter_only_apps_with_icon=bool(self.cb_only_res.isChecked()),
+                use_theme_fallback=bool(self.cb_theme_fallback.isChecked()),
+            )
+        if directories:
+            disabled = []; custom = []; shown = set()
+            for i in range(self.list_dirs.count()):
+                item = self.list_dirs.item(i)
+                info = item.data(Qt.UserRole) or {}
+                path = info.get("path"); shown.add(path)
+                if not info.get("is_system", True): custom.append(path)
+                if item.checkState() != Qt.Checked: disabled.append(path)
+            # Keep disabled default dirs that are not listed because they don't exist right now
+            # (e.g. flatpak/snap exports), so they stay disabled when they reappear
+            old_custom = set(getattr(self._settings, "desktop_dirs_custom", []) or [])
+            for path in getattr(self._settings, "desktop_dirs_disabled", []) or []:
+                if path not in shown and path not in old_custom: disabled.append(path)
+            kw.update(desktop_dirs_custom=custom, desktop_dirs_disabled=disabled)
+
+        if kw:
+            self._settings = replace(self._settings, **kw)
 
     def _on_apply_clicked(self):
         """Apply changes without closing the dialog"""
@@ -804,8 +915,8 @@ class SettingsDialog(QDialog):
         """Save settings and close the dialog"""
         self._read_form()
         try:
-            save_settings(self._settings)
-            QMessageBox.information(self, "Saved", f"Preferences have been successfully saved.\n\nLocation:\n{CONFIG_FILE}")
+            target = save_settings(self._settings)
+            QMessageBox.information(self, "Saved", f"Preferences have been successfully saved.\n\nLocation:\n{target}")
             self.accept()
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Preferences could not be saved:\n{str(e)}")
@@ -26,7 +26,7 @@ from typing import Optional, Tuple, List
 from PIL import Image, ImageFilter
 
 from .wallpapers.detect import find_wallpaper
-from .config.io import get_runtime_paths, load_settings
+from .config.io import get_runtime_paths, load_settings, save_runtime_state
 
 try:
     from .utils.plasma import set_plasma_wallpaper_force
@@ -58,13 +58,21 @@ def _read_json(p: Path) -> Optional[dict]:
 
 def _save_json(p: Path, data: dict) -> None:
     try:
-        p.parent.mkdir(parents=True, exist_ok=True)
-        tmp = p.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-        tmp.replace(p)
+        save_runtime_state(p, data)
     except Exception as ex:
         print(f"SYNC: WARNING: cannot save state {p}: {ex}")
 
+def _publish(src: Path, dst: Path) -> None:
+    # Hard-link the rendered file into place instead of writing the image a
+    # second time; the rename also keeps readers from seeing a partial file.
+    tmp = dst.with_name(dst.name + ".tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        os.link(src, tmp)
+        os.replace(tmp, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 def _which(cmd: str) -> Optional[str]:
     from shutil import which
     return which(cmd)
@@ -354,7 +362,7 @@ def main() -> int:
     if canonical is not None:
         try:
             canonical.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(out_file, canonical)
+            _publish(out_file, canonical)
             print(f"SYNC: Copied to canonical: {out_file} -> {canonical}")
         except Exception as ex3:
             print(f"SYNC: WARNING: cannot copy to canonical wp: {ex3}")